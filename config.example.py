@@ -74,6 +74,7 @@ POMODORO_SHORT_BREAK_MINUTES = 5     # Duration of short breaks (default: 5 minu
 POMODORO_LONG_BREAK_MINUTES = 15     # Duration of long breaks (default: 15 minutes)
 POMODORO_DAILY_GOAL = 8              # Daily pomodoro goal (default: 8 pomodoros)
 POMODORO_LONG_BREAK_INTERVAL = 4     # Pomodoros before long break (default: 4)
+POMODORO_HISTORY_DAYS = 0            # Days of session history to keep (default: 0 = keep everything)
 
 # Future module settings can be added here as you expand the application
 
@@ -15,12 +15,141 @@ Enhanced features:
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import time
+import tkinter.font as tkfont
 import json
+import math
 import os
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 import threading
+import time
 import csv
+import atexit
+import queue
+from functools import partial
+
+from json_utils import dumps as _dumps, loads as _loads
+
+
+def _is_day_entry(key, entry):
+    """True for a stats day stored under a canonical YYYY-MM-DD key."""
+    try:
+        return date.fromisoformat(key).isoformat() == key and isinstance(entry, dict)
+    except (TypeError, ValueError):
+        return False
+
+
+def _blend(fg, bg, alpha):
+    """Mix two #RRGGBB colours; Tk has no alpha channel."""
+    f = [int(fg[i:i + 2], 16) for i in (1, 3, 5)]
+    b = [int(bg[i:i + 2], 16) for i in (1, 3, 5)]
+    return "#" + "".join(f"{round(x * alpha + y * (1 - alpha)):02x}" for x, y in zip(f, b))
+
+
+# Stats are shared by every PomodoroModule instance in the process: the file
+# is read once and all instances mutate the same dict (guarded by the lock)
+_STATS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)),
+    "data",
+    "pomodoro_stats.json"
+)
+_STATS_LOCK = threading.Lock()
+_STATS_CACHE = None
+
+# Zero-padded seconds for the countdown display
+_SEC_STR = tuple(f"{i:02d}" for i in range(60))
+
+# Stats writes run on one background worker so the UI never waits on disk
+_STATS_QUEUE = queue.Queue()
+_stats_worker = None
+_stats_dir_ready = False
+
+
+def _stats_worker_loop():
+    """Run queued stats jobs in order."""
+    while True:
+        job = _STATS_QUEUE.get()
+        try:
+            job()
+        except Exception as e:
+            # Keep the worker alive so later writes (and flush waits) still complete
+            print(f"Error saving pomodoro stats: {e}")
+        finally:
+            _STATS_QUEUE.task_done()
+
+
+def _post_stats_job(job):
+    """Queue a job for the stats worker, starting the worker on first use."""
+    global _stats_worker
+    if _stats_worker is None:
+        _stats_worker = threading.Thread(target=_stats_worker_loop, daemon=True)
+        _stats_worker.start()
+    _STATS_QUEUE.put_nowait(job)
+
+
+def _write_stats_file(data):
+    """Atomically replace the stats file with already-serialized bytes."""
+    global _stats_dir_ready
+    tmp_file = _STATS_PATH + ".tmp"
+    try:
+        with _STATS_LOCK:
+            # Ensure data directory exists (once per process)
+            if not _stats_dir_ready:
+                os.makedirs(os.path.dirname(_STATS_PATH), exist_ok=True)
+                _stats_dir_ready = True
+            
+            # Save (compact JSON: the file is machine-read only)
+            with open(tmp_file, 'wb', buffering=1 << 16) as f:
+                f.write(data)
+            os.replace(tmp_file, _STATS_PATH)
+    
+    except IOError as e:
+        print(f"Error saving pomodoro stats: {e}")
+
+
+# (Figure, FigureCanvasTkAgg) once matplotlib has been imported
+_MPL = None
+
+
+def _load_matplotlib():
+    """Import the matplotlib pieces used by the stats window, once per process."""
+    global _MPL
+    if _MPL is None:
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+        _MPL = (Figure, FigureCanvasTkAgg)
+    return _MPL
+
+
+# Named fonts used by the module: name -> (size, weight, slant)
+_FONT_SPECS = {
+    "PomoTimer": (72, "bold", "roman"),
+    "PomoTitle": (18, "bold", "roman"),
+    "PomoStatsTitle": (16, "bold", "roman"),
+    "PomoButton": (14, "bold", "roman"),
+    "PomoSubtitle": (14, "normal", "roman"),
+    "PomoProgress": (20, "normal", "roman"),
+    "PomoHeading": (12, "bold", "roman"),
+    "PomoTextBold": (11, "bold", "roman"),
+    "PomoText": (11, "normal", "roman"),
+    "PomoSmallBold": (10, "bold", "roman"),
+    "PomoSmall": (10, "normal", "roman"),
+    "PomoInfo": (9, "normal", "italic"),
+    "PomoTooltip": (9, "normal", "roman"),
+    "PomoTiny": (8, "normal", "roman"),
+}
+# Keep references: tkinter deletes a named font when its Font object is collected
+_NAMED_FONTS = {}
+
+
+def _init_fonts(root):
+    """Create the module's named fonts once per interpreter."""
+    existing = tkfont.names(root)
+    for name, (size, weight, slant) in _FONT_SPECS.items():
+        if name not in existing:
+            _NAMED_FONTS[name] = tkfont.Font(
+                root=root, name=name, family="Segoe UI",
+                size=size, weight=weight, slant=slant
+            )
 
 
 class PomodoroModule:
@@ -38,6 +167,13 @@ class PomodoroModule:
     """
     ICON = "🍅"
     PRIORITY = 8
+    
+    # Push Discord presence at most this often (Discord rate-limits to ~15s)
+    DISCORD_UPDATE_SECONDS = 15
+    # Debounce window for stats writes
+    STATS_SAVE_DELAY_MS = 2000
+    # Above this many changed heatmap cells, repaint the whole image at once
+    HEATMAP_BULK_CELLS = 16
 
     def __init__(self, parent_frame, colors):
         """
@@ -51,41 +187,89 @@ class PomodoroModule:
         self.parent = parent_frame
         self.colors = colors
         
-        # Load or create stats (with migration from v1)
-        self.stats = self.load_stats()
-        
-        # Get settings (from stats > config > defaults)
-        self.settings = self.get_settings(self.stats)
+        # Session label (text, colour) per session type
+        self._session_states = {
+            "work": ("WORK SESSION", self.colors['accent']),
+            "short": ("SHORT BREAK", self.colors['success']),
+            "long": ("LONG BREAK", self.colors['success'])
+        }
         
-        # Timer settings (in seconds)
-        self.WORK_TIME = self.settings['work_minutes'] * 60
-        self.SHORT_BREAK = self.settings['short_break_minutes'] * 60
-        self.LONG_BREAK = self.settings['long_break_minutes'] * 60
-        self.DAILY_GOAL = self.settings['daily_goal']
-        self.LONG_BREAK_INTERVAL = self.settings['long_break_interval']
+        # Stats are read from disk after the first paint (see _ensure_stats_loaded);
+        # until then run on config/default settings and an empty history
+        self._stats_loaded = False
+        self.stats = {
+            "version": 2,
+            "settings": self.get_settings(None),
+            "days": {}
+        }
         
         # Timer state
-        self.time_left = self.WORK_TIME
         self.is_running = False
         self.is_work_session = True
         self.pomodoros_completed = 0
-        self.total_today = self.get_today_count()
+        # total_today is kept incrementally for the day in _today_key
+        self._today_key = date.today().isoformat()
+        self.total_today = 0
         self.current_task = ""
         
+        # Get settings (from stats > config > defaults) and derive timer values
+        self._apply_settings(self.get_settings(self.stats))
+        
+        # Display cache (minute prefix of the MM:SS string)
+        self._last_minute = -1
+        self._minute_str = ""
+        
         # Session tracking
         self._session_start_time = None
         
-        # Thread management
-        self.timer_thread = None
-        self._stop_timer = False
+        # Discord presence hook, resolved once (None when unavailable)
+        try:
+            from discord_presence_module import set_presence
+            self._set_presence = set_presence
+        except Exception:
+            self._set_presence = None
+        # Monotonic time of the last push; 0 forces the next one through
+        self._last_discord_push = 0.0
+        self._refresh_discord_text()
+        
+        # Stats persistence (writes within STATS_SAVE_DELAY_MS are coalesced;
+        # anything pending is flushed on teardown and at interpreter exit)
+        self._stats_dirty = False
+        self._save_after_id = None
+        atexit.register(self._flush_stats, True)
+        
+        # Countdown runs on the Tk event loop against a monotonic deadline;
+        # _after_id is the pending tick
+        self._after_id = None
+        self._deadline = 0.0
         self._destroyed = False
         
         # Settings panel state
         self.settings_visible = False
         
+        # Per-period chart arrays (see _daily_counts) and the reusable stats figure
+        self._chart_cache = None
+        self._stats_fig = None
+        self._stats_window = None
+        self._chart_key = None
+        # Year heatmap canvas/image kept for incremental repaints (see draw_heatmap)
+        self._heatmap = None
+        
         # Create the UI
+        _init_fonts(self.parent)
         self.create_ui()
         
+        # Stop the countdown as soon as the module's widgets go away
+        self.timer_display.bind("<Destroy>", self._on_destroy, add="+")
+        
+        # Only repaint the countdown while it is on screen
+        self._visible = True
+        for sequence in ("<Map>", "<Unmap>", "<Visibility>"):
+            self.timer_display.bind(sequence, self._on_visibility, add="+")
+        
+        # Read the stats file once the tab has painted
+        self.parent.after_idle(self._ensure_stats_loaded)
+        
         # Update progress indicator
         self.update_progress_indicator()
         
@@ -117,9 +301,62 @@ class PomodoroModule:
             'long_break_interval': 4
         }
     
+    def _apply_settings(self, settings):
+        """Adopt a settings dict and derive the timer durations from it."""
+        self.settings = settings
+        
+        # Timer settings (in seconds)
+        self.WORK_TIME = settings['work_minutes'] * 60
+        self.SHORT_BREAK = settings['short_break_minutes'] * 60
+        self.LONG_BREAK = settings['long_break_minutes'] * 60
+        self.DAILY_GOAL = settings['daily_goal']
+        self.LONG_BREAK_INTERVAL = settings['long_break_interval']
+        
+        # Progress dots for every position in the set, rebuilt only when the interval changes
+        interval = self.LONG_BREAK_INTERVAL
+        if len(getattr(self, '_indicator_cache', ())) != interval:
+            self._indicator_cache = ["●" * i + "○" * (interval - i) for i in range(interval)]
+        
+        # Reset timer if not running
+        if not self.is_running:
+            if self.is_work_session:
+                self.time_left = self.WORK_TIME
+            else:
+                if self.pomodoros_completed % self.LONG_BREAK_INTERVAL == 0:
+                    self.time_left = self.LONG_BREAK
+                else:
+                    self.time_left = self.SHORT_BREAK
+    
+    def _ensure_stats_loaded(self):
+        """Load the stats file on first use and refresh everything derived from it."""
+        if self._stats_loaded or self._destroyed:
+            return
+        self._stats_loaded = True
+        
+        # Load or create stats (with migration from v1)
+        self.stats = self.load_stats()
+        self._apply_settings(self.get_settings(self.stats))
+        self._today_key = date.today().isoformat()
+        self.total_today = self.get_today_count()
+        
+        self._sync_settings_panel()
+        self._refresh_discord_text()
+        self.update_progress_indicator()
+        self.update_goal_progress()
+        self.update_display()
+    
     def create_ui(self):
         """Create the enhanced user interface."""
         
+        # Labels updated while the timer runs are bound to StringVars; the
+        # cache holds the last value pushed to each (see _set_text)
+        self._text_cache = {}
+        self.timer_var = tk.StringVar(value=f"{self.WORK_TIME // 60:02d}:00")
+        self.session_var = tk.StringVar(value=self._session_states["work"][0])
+        self.progress_var = tk.StringVar(value="○○○○")
+        self.goal_var = tk.StringVar()
+        self._session_fg = self._session_states["work"][1]
+        
         # Title with settings gear
         title_frame = tk.Frame(self.parent, bg=self.colors['content_bg'])
         title_frame.pack(pady=20)
@@ -127,7 +364,7 @@ class PomodoroModule:
         tk.Label(
             title_frame,
             text="🍅 Pomodoro Timer",
-            font=("Segoe UI", 18, "bold"),
+            font="PomoTitle",
             bg=self.colors['content_bg'],
             fg=self.colors['text']
         ).pack(side=tk.LEFT)
@@ -136,7 +373,7 @@ class PomodoroModule:
         tk.Button(
             title_frame,
             text="⚙️",
-            font=("Segoe UI", 14),
+            font="PomoSubtitle",
             bg=self.colors['card_bg'],
             fg=self.colors['text'],
             cursor="hand2",
@@ -153,14 +390,14 @@ class PomodoroModule:
         tk.Label(
             task_frame,
             text="What are you working on?",
-            font=("Segoe UI", 10),
+            font="PomoSmall",
             bg=self.colors['content_bg'],
             fg=self.colors['text_dim']
         ).pack(anchor=tk.W)
         
         self.task_entry = tk.Entry(
             task_frame,
-            font=("Segoe UI", 11),
+            font="PomoText",
             bg=self.colors['card_bg'],
             fg=self.colors['text'],
             insertbackground=self.colors['text'],
@@ -172,18 +409,18 @@ class PomodoroModule:
         # Session type label
         self.session_label = tk.Label(
             self.parent,
-            text="WORK SESSION",
-            font=("Segoe UI", 14, "bold"),
+            textvariable=self.session_var,
+            font="PomoButton",
             bg=self.colors['content_bg'],
-            fg=self.colors['accent']
+            fg=self._session_fg
         )
         self.session_label.pack(pady=10)
         
         # Timer display
         self.timer_display = tk.Label(
             self.parent,
-            text="25:00",
-            font=("Segoe UI", 72, "bold"),
+            textvariable=self.timer_var,
+            font="PomoTimer",
             bg=self.colors['content_bg'],
             fg=self.colors['text']
         )
@@ -195,8 +432,8 @@ class PomodoroModule:
         
         self.progress_label = tk.Label(
             self.progress_frame,
-            text="○○○○",
-            font=("Segoe UI", 20),
+            textvariable=self.progress_var,
+            font="PomoProgress",
             bg=self.colors['content_bg'],
             fg=self.colors['accent']
         )
@@ -209,7 +446,7 @@ class PomodoroModule:
         self.start_button = tk.Button(
             button_frame,
             text="▶ Start",
-            font=("Segoe UI", 14, "bold"),
+            font="PomoButton",
             bg=self.colors['accent'],
             fg="white",
             activebackground=self.colors['button_hover'],
@@ -226,7 +463,7 @@ class PomodoroModule:
         reset_button = tk.Button(
             button_frame,
             text="⟲ Reset",
-            font=("Segoe UI", 14, "bold"),
+            font="PomoButton",
             bg=self.colors['card_bg'],
             fg=self.colors['text'],
             activebackground=self.colors['button_hover'],
@@ -252,7 +489,7 @@ class PomodoroModule:
         tk.Label(
             goal_frame,
             text="📊 Daily Goal Progress",
-            font=("Segoe UI", 12, "bold"),
+            font="PomoHeading",
             bg=self.colors['card_bg'],
             fg=self.colors['text']
         ).pack(pady=(10, 5))
@@ -269,10 +506,23 @@ class PomodoroModule:
         )
         self.progress_bar_canvas.pack(fill=tk.X)
         
+        # Items are created once; update_goal_progress only moves/recolours them
+        self._goal_bg_rect = self.progress_bar_canvas.create_rectangle(
+            0, 0, 0, 30, fill=self.colors['background'], outline=""
+        )
+        self._goal_fill_rect = self.progress_bar_canvas.create_rectangle(
+            0, 0, 0, 30, fill=self.colors['accent'], outline=""
+        )
+        self._goal_text = self.progress_bar_canvas.create_text(
+            0, 15, text="", font="PomoTextBold", fill=self.colors['text']
+        )
+        self._last_goal_state = None
+        self.progress_bar_canvas.bind("<Configure>", lambda e: self.update_goal_progress())
+        
         self.goal_label = tk.Label(
             goal_frame,
-            text=f"Completed: {self.total_today}/{self.DAILY_GOAL} | Focus time: {self.total_today * self.settings['work_minutes']} min",
-            font=("Segoe UI", 10),
+            textvariable=self.goal_var,
+            font="PomoSmall",
             bg=self.colors['card_bg'],
             fg=self.colors['text_dim']
         )
@@ -288,7 +538,7 @@ class PomodoroModule:
         tk.Button(
             action_frame,
             text="📈 View Stats",
-            font=("Segoe UI", 10),
+            font="PomoSmall",
             bg=self.colors['accent'],
             fg="white",
             cursor="hand2",
@@ -302,7 +552,7 @@ class PomodoroModule:
         self.settings_frame = tk.LabelFrame(
             self.parent,
             text="⚙️ Settings",
-            font=("Segoe UI", 11, "bold"),
+            font="PomoTextBold",
             bg=self.colors['card_bg'],
             fg=self.colors['text'],
             relief=tk.RAISED,
@@ -316,7 +566,7 @@ class PomodoroModule:
         tk.Label(
             self.parent,
             text="💡 Tip: Stay focused during work sessions, rest during breaks!",
-            font=("Segoe UI", 9, "italic"),
+            font="PomoInfo",
             bg=self.colors['content_bg'],
             fg=self.colors['text_dim']
         ).pack(pady=10)
@@ -330,7 +580,7 @@ class PomodoroModule:
         tk.Label(
             settings_grid,
             text="Work Duration (min):",
-            font=("Segoe UI", 10),
+            font="PomoSmall",
             bg=self.colors['card_bg'],
             fg=self.colors['text']
         ).grid(row=0, column=0, sticky=tk.W, pady=5, padx=(0, 10))
@@ -339,18 +589,16 @@ class PomodoroModule:
             settings_grid,
             from_=1,
             to=60,
-            font=("Segoe UI", 10),
+            font="PomoSmall",
             width=10
         )
-        self.work_spin.delete(0, tk.END)
-        self.work_spin.insert(0, str(self.settings['work_minutes']))
         self.work_spin.grid(row=0, column=1, pady=5)
         
         # Short break
         tk.Label(
             settings_grid,
             text="Short Break (min):",
-            font=("Segoe UI", 10),
+            font="PomoSmall",
             bg=self.colors['card_bg'],
             fg=self.colors['text']
         ).grid(row=1, column=0, sticky=tk.W, pady=5, padx=(0, 10))
@@ -359,18 +607,16 @@ class PomodoroModule:
             settings_grid,
             from_=1,
             to=30,
-            font=("Segoe UI", 10),
+            font="PomoSmall",
             width=10
         )
-        self.short_break_spin.delete(0, tk.END)
-        self.short_break_spin.insert(0, str(self.settings['short_break_minutes']))
         self.short_break_spin.grid(row=1, column=1, pady=5)
         
         # Long break
         tk.Label(
             settings_grid,
             text="Long Break (min):",
-            font=("Segoe UI", 10),
+            font="PomoSmall",
             bg=self.colors['card_bg'],
             fg=self.colors['text']
         ).grid(row=2, column=0, sticky=tk.W, pady=5, padx=(0, 10))
@@ -379,18 +625,16 @@ class PomodoroModule:
             settings_grid,
             from_=1,
             to=60,
-            font=("Segoe UI", 10),
+            font="PomoSmall",
             width=10
         )
-        self.long_break_spin.delete(0, tk.END)
-        self.long_break_spin.insert(0, str(self.settings['long_break_minutes']))
         self.long_break_spin.grid(row=2, column=1, pady=5)
         
         # Daily goal
         tk.Label(
             settings_grid,
             text="Daily Goal (pomodoros):",
-            font=("Segoe UI", 10),
+            font="PomoSmall",
             bg=self.colors['card_bg'],
             fg=self.colors['text']
         ).grid(row=3, column=0, sticky=tk.W, pady=5, padx=(0, 10))
@@ -399,18 +643,16 @@ class PomodoroModule:
             settings_grid,
             from_=1,
             to=20,
-            font=("Segoe UI", 10),
+            font="PomoSmall",
             width=10
         )
-        self.goal_spin.delete(0, tk.END)
-        self.goal_spin.insert(0, str(self.settings['daily_goal']))
         self.goal_spin.grid(row=3, column=1, pady=5)
         
         # Long break interval
         tk.Label(
             settings_grid,
             text="Long Break Interval:",
-            font=("Segoe UI", 10),
+            font="PomoSmall",
             bg=self.colors['card_bg'],
             fg=self.colors['text']
         ).grid(row=4, column=0, sticky=tk.W, pady=5, padx=(0, 10))
@@ -419,18 +661,17 @@ class PomodoroModule:
             settings_grid,
             from_=2,
             to=8,
-            font=("Segoe UI", 10),
+            font="PomoSmall",
             width=10
         )
-        self.interval_spin.delete(0, tk.END)
-        self.interval_spin.insert(0, str(self.settings['long_break_interval']))
         self.interval_spin.grid(row=4, column=1, pady=5)
+        self._sync_settings_panel()
         
         # Save button
         tk.Button(
             self.settings_frame,
             text="💾 Save Settings",
-            font=("Segoe UI", 10, "bold"),
+            font="PomoSmallBold",
             bg=self.colors['success'],
             fg="white",
             cursor="hand2",
@@ -440,6 +681,26 @@ class PomodoroModule:
             pady=8
         ).pack(pady=(5, 15))
     
+    def _set_text(self, var, text):
+        """Write a label's StringVar only when the text actually changes."""
+        name = str(var)
+        if self._text_cache.get(name) == text:
+            return
+        self._text_cache[name] = text
+        var.set(text)
+    
+    def _sync_settings_panel(self):
+        """Show the current settings in the settings panel's spinboxes."""
+        for spin, key in (
+            (self.work_spin, 'work_minutes'),
+            (self.short_break_spin, 'short_break_minutes'),
+            (self.long_break_spin, 'long_break_minutes'),
+            (self.goal_spin, 'daily_goal'),
+            (self.interval_spin, 'long_break_interval'),
+        ):
+            spin.delete(0, tk.END)
+            spin.insert(0, str(self.settings[key]))
+    
     def toggle_settings(self):
         """Show/hide settings panel."""
         if self.settings_visible:
@@ -459,33 +720,23 @@ class PomodoroModule:
             goal = int(self.goal_spin.get())
             interval = int(self.interval_spin.get())
             
-            # Update settings
-            self.settings = {
+            # Make sure we don't overwrite a stats file we haven't read yet
+            self._ensure_stats_loaded()
+            
+            # Update settings and timer values
+            self._apply_settings({
                 'work_minutes': work_min,
                 'short_break_minutes': short_min,
                 'long_break_minutes': long_min,
                 'daily_goal': goal,
                 'long_break_interval': interval
-            }
-            
-            # Update timer values
-            self.WORK_TIME = work_min * 60
-            self.SHORT_BREAK = short_min * 60
-            self.LONG_BREAK = long_min * 60
-            self.DAILY_GOAL = goal
-            self.LONG_BREAK_INTERVAL = interval
-            
-            # Reset timer if not running
+            })
+            self._sync_settings_panel()
             if not self.is_running:
-                if self.is_work_session:
-                    self.time_left = self.WORK_TIME
-                else:
-                    if self.pomodoros_completed % interval == 0:
-                        self.time_left = self.LONG_BREAK
-                    else:
-                        self.time_left = self.SHORT_BREAK
                 self.update_display()
             
+            self._refresh_discord_text()
+            
             # Save to file
             self.stats['settings'] = self.settings
             self.save_stats()
@@ -504,39 +755,34 @@ class PomodoroModule:
             return
             
         canvas = self.progress_bar_canvas
-        canvas.delete("all")
         
         width = canvas.winfo_width()
         if width <= 1:
             width = 400  # Default width
         height = 30
         
+        # Nothing to redraw unless the count, goal, session length or width changed
+        state = (self.total_today, self.DAILY_GOAL, self.settings['work_minutes'], width)
+        if state == self._last_goal_state:
+            return
+        self._last_goal_state = state
+        
         # Calculate progress
         progress = min(self.total_today / self.DAILY_GOAL, 1.0) if self.DAILY_GOAL > 0 else 0
         fill_width = int(width * progress)
+        color = self.colors['success'] if progress >= 1.0 else self.colors['accent']
         
-        # Draw background
-        canvas.create_rectangle(0, 0, width, height, fill=self.colors['background'], outline="")
-        
-        # Draw filled portion
-        if fill_width > 0:
-            color = self.colors['success'] if progress >= 1.0 else self.colors['accent']
-            canvas.create_rectangle(0, 0, fill_width, height, fill=color, outline="")
-        
-        # Draw text
-        text = f"{self.total_today}/{self.DAILY_GOAL}"
-        canvas.create_text(
-            width // 2,
-            height // 2,
-            text=text,
-            font=("Segoe UI", 11, "bold"),
-            fill=self.colors['text']
-        )
+        canvas.coords(self._goal_bg_rect, 0, 0, width, height)
+        canvas.coords(self._goal_fill_rect, 0, 0, fill_width, height)
+        canvas.itemconfig(self._goal_fill_rect, fill=color)
+        canvas.coords(self._goal_text, width // 2, height // 2)
+        canvas.itemconfig(self._goal_text, text=f"{self.total_today}/{self.DAILY_GOAL}")
         
         # Update label
         focus_min = self.total_today * self.settings['work_minutes']
-        self.goal_label.config(
-            text=f"Completed: {self.total_today}/{self.DAILY_GOAL} | Focus time: {focus_min} min"
+        self._set_text(
+            self.goal_var,
+            f"Completed: {self.total_today}/{self.DAILY_GOAL} | Focus time: {focus_min} min"
         )
     
     def toggle_timer(self):
@@ -544,86 +790,142 @@ class PomodoroModule:
         if self.is_running:
             # Pause
             self.is_running = False
-            self._stop_timer = True
+            self._cancel_tick()
             self.start_button.config(text="▶ Resume")
         else:
             # Start
             self.is_running = True
-            self._stop_timer = False
             self.start_button.config(text="⏸ Pause")
             
             # Record session start time (for work sessions)
             if self.is_work_session and self._session_start_time is None:
                 self._session_start_time = datetime.now()
                 self.current_task = self.task_entry.get().strip() or "Focus session"
+            self._refresh_discord_text()
+            self._last_discord_push = 0.0
             
-            # Start timer thread
-            self.timer_thread = threading.Thread(target=self.run_timer, daemon=True)
-            self.timer_thread.start()
+            # Schedule the first tick
+            self._deadline = time.monotonic() + self.time_left
+            self._after_id = self.parent.after(250, self._tick)
     
-    def run_timer(self):
-        """Run the countdown timer in a separate thread."""
-        while self.is_running and self.time_left > 0:
-            if self._stop_timer or self._destroyed:
-                break
-                
-            time.sleep(1)
-            self.time_left -= 1
-            
-            try:
-                self.parent.after(0, self.update_display)
-            except tk.TclError:
-                self._destroyed = True
-                break
+    def _tick(self):
+        """Sync the countdown with the deadline on the Tk event loop."""
+        self._after_id = None
+        if not self.is_running:
+            return
+        # The <Destroy> binding flips _destroyed; winfo_exists covers the gap
+        if self._destroyed or not self.timer_display.winfo_exists():
+            self._destroyed = True
+            self.is_running = False
+            return
         
-        # Timer complete
-        if self.time_left == 0 and self.is_running and not self._destroyed:
-            try:
-                self.parent.after(0, self.timer_complete)
-            except tk.TclError:
-                self._destroyed = True
+        # Rebase on the deadline so scheduling latency never accumulates
+        remaining = max(0, math.ceil(self._deadline - time.monotonic()))
+        if remaining != self.time_left:
+            self.time_left = remaining
+            self._check_day_rollover()
+            self.update_display()
+        
+        if remaining == 0:
+            self.timer_complete()
+        else:
+            self._after_id = self.parent.after(250, self._tick)
+    
+    def _check_day_rollover(self):
+        """Re-seed today's count when the date changes while the app is open."""
+        today = date.today().isoformat()
+        if today == self._today_key:
+            return
+        self._today_key = today
+        self.total_today = self.get_today_count()
+        self._refresh_discord_text()
+        self.update_goal_progress()
+    
+    def _cancel_tick(self):
+        """Drop the pending countdown tick, if any."""
+        if self._after_id is not None:
+            self.parent.after_cancel(self._after_id)
+            self._after_id = None
+    
+    def _on_destroy(self, event=None):
+        """Stop the countdown when the module is torn down."""
+        self._destroyed = True
+        self.is_running = False
+        self._cancel_tick()
+        # Write any pending stats now rather than waiting for the debounce
+        if self._save_after_id is not None:
+            self.parent.after_cancel(self._save_after_id)
+        self._flush_stats(wait=True)
+        # Flushed already; don't keep this instance alive until exit
+        atexit.unregister(self._flush_stats)
+    
+    def _on_visibility(self, event):
+        """Track whether the timer label can be seen and repaint it when it can."""
+        if event.type == tk.EventType.Unmap:
+            visible = False
+        else:
+            visible = getattr(event, "state", None) != "VisibilityFullyObscured"
+        if visible and not self._visible:
+            self._visible = True
+            self.update_display()
+        else:
+            self._visible = visible
     
     def update_display(self):
         """Update timer display."""
-        if self._destroyed:
-            return
-        try:
-            minutes = self.time_left // 60
-            seconds = self.time_left % 60
-            time_str = f"{minutes:02d}:{seconds:02d}"
-            self.timer_display.config(text=time_str)
-            
-            # Update Discord presence
-            if self.is_running:
-                self.update_discord_status(time_str)
-                
-        except tk.TclError:
+        if self._destroyed or not self.timer_display.winfo_exists():
             self._destroyed = True
             self.is_running = False
+            return
+        
+        minutes, seconds = divmod(self.time_left, 60)
+        # The minute prefix only changes once every 60 ticks
+        if minutes != self._last_minute:
+            self._last_minute = minutes
+            self._minute_str = f"{minutes:02d}:"
+        time_str = self._minute_str + _SEC_STR[seconds]
+        # Skip the label while the tab is hidden; _on_visibility repaints it
+        if self._visible:
+            self._set_text(self.timer_var, time_str)
+        
+        # Update Discord presence (first tick after a start, then throttled)
+        if self.is_running:
+            now = time.monotonic()
+            if now - self._last_discord_push >= self.DISCORD_UPDATE_SECONDS:
+                self._last_discord_push = now
+                self.update_discord_status(time_str)
+    
+    def _refresh_discord_text(self):
+        """Precompute the Discord status template for the current session."""
+        if self.is_work_session:
+            task = self.current_task or "Focus session"
+            # Double any braces the user typed so format() leaves them literal
+            task = task.replace("{", "{{").replace("}", "}}")
+            self._discord_template = (
+                f"🍅 Focusing on: {task}\n{{t}} remaining | "
+                f"{self.total_today}/{self.DAILY_GOAL} today"
+            )
+        else:
+            if self.pomodoros_completed % self.LONG_BREAK_INTERVAL == 0:
+                self._discord_template = "☕ Long break\n{t} remaining"
+            else:
+                self._discord_template = "☕ Short break\n{t} remaining"
     
     def update_discord_status(self, time_str):
         """Update Discord with current status and task label."""
+        if self._set_presence is None:
+            return
         try:
-            from discord_presence_module import set_presence
-            
-            if self.is_work_session:
-                task = self.current_task or "Focus session"
-                status = f"🍅 Focusing on: {task}"
-                details = f"{time_str} remaining | {self.total_today}/{self.DAILY_GOAL} today"
-            else:
-                if self.pomodoros_completed % self.LONG_BREAK_INTERVAL == 0:
-                    status = f"☕ Long break"
-                else:
-                    status = f"☕ Short break"
-                details = f"{time_str} remaining"
-            
-            set_presence("Pomodoro", f"{status}\n{details}")
-        except:
-            pass
+            self._set_presence("Pomodoro", self._discord_template.format(t=time_str))
+        except (OSError, RuntimeError, AttributeError, tk.TclError):
+            # Stop trying after the first failure; later ticks just see None
+            self._set_presence = None
     
     def timer_complete(self):
         """Handle timer completion."""
+        self._ensure_stats_loaded()
         self.is_running = False
+        self._last_discord_push = 0.0
         self.start_button.config(text="▶ Start")
         
         # Play beep
@@ -631,8 +933,14 @@ class PomodoroModule:
         
         if self.is_work_session:
             # Work session completed
+            self._check_day_rollover()
             self.pomodoros_completed += 1
             self.total_today += 1
+            completed = self.pomodoros_completed
+            settings = self.settings
+            
+            # Send notification (before record_session clears the task label)
+            self.send_pomodoro_notification()
             
             # Record session
             self.record_session()
@@ -640,43 +948,78 @@ class PomodoroModule:
             # Save stats
             self.save_stats()
             
-            # Send notification
-            self.send_pomodoro_notification()
-            
             # Update UI
             self.update_progress_indicator()
             self.update_goal_progress()
             
             # Determine next session
-            if self.pomodoros_completed % self.LONG_BREAK_INTERVAL == 0:
+            self.is_work_session = False
+            if completed % self.LONG_BREAK_INTERVAL == 0:
+                state_key = "long"
                 self.time_left = self.LONG_BREAK
-                self.is_work_session = False
-                self.session_label.config(text="LONG BREAK", fg=self.colors['success'])
-                messagebox.showinfo(
-                    "Great Work! 🎉",
-                    f"You completed {self.pomodoros_completed} pomodoros!\nTime for a {self.settings['long_break_minutes']}-minute break."
-                )
+                title = "Great Work! 🎉"
+                message = f"You completed {completed} pomodoros!\nTime for a {settings['long_break_minutes']}-minute break."
             else:
+                state_key = "short"
                 self.time_left = self.SHORT_BREAK
-                self.is_work_session = False
-                self.session_label.config(text="SHORT BREAK", fg=self.colors['success'])
-                messagebox.showinfo(
-                    "Work Complete! ✅",
-                    f"Great job! Take a {self.settings['short_break_minutes']}-minute break."
-                )
+                title = "Work Complete! ✅"
+                message = f"Great job! Take a {settings['short_break_minutes']}-minute break."
         else:
             # Break completed
+            state_key = "work"
             self.time_left = self.WORK_TIME
             self.is_work_session = True
-            self.session_label.config(text="WORK SESSION", fg=self.colors['accent'])
             self._session_start_time = None  # Reset for next session
-            messagebox.showinfo(
-                "Break Over! 💪",
-                "Ready to focus again? Let's start another pomodoro!"
-            )
+            title = "Break Over! 💪"
+            message = "Ready to focus again? Let's start another pomodoro!"
+        
+        text, fg = self._session_states[state_key]
+        self._set_text(self.session_var, text)
+        if fg != self._session_fg:
+            self._session_fg = fg
+            self.session_label.config(fg=fg)
+        self._show_toast(title, message)
         
         self.update_display()
     
+    def _show_toast(self, title, message, duration_ms=5000):
+        """Show a non-modal, self-dismissing completion toast (top-right of the app window)."""
+        root = self.parent.winfo_toplevel()
+        # Owned by the app window, not the content frame, so it never becomes
+        # the frame's last child that toggle_settings packs before
+        toast = tk.Toplevel(root)
+        toast.wm_overrideredirect(True)
+        toast.attributes("-topmost", True)
+        toast.configure(bg=self.colors['card_bg'])
+        
+        tk.Label(
+            toast,
+            text=title,
+            font="PomoHeading",
+            bg=self.colors['card_bg'],
+            fg=self.colors['text'],
+            anchor=tk.W
+        ).pack(fill=tk.X, padx=15, pady=(12, 2))
+        
+        tk.Label(
+            toast,
+            text=message,
+            font="PomoSmall",
+            bg=self.colors['card_bg'],
+            fg=self.colors['text_dim'],
+            justify=tk.LEFT,
+            anchor=tk.W
+        ).pack(fill=tk.X, padx=15, pady=(0, 12))
+        
+        toast.update_idletasks()
+        x = root.winfo_rootx() + root.winfo_width() - toast.winfo_reqwidth() - 20
+        y = root.winfo_rooty() + 20
+        toast.wm_geometry(f"+{x}+{y}")
+        
+        # Click to dismiss early; otherwise it closes itself
+        toast.bind("<Button-1>", lambda e: toast.destroy())
+        self.parent.after(duration_ms, lambda: toast.winfo_exists() and toast.destroy())
+    
     def record_session(self):
         """Record completed work session details."""
         if self._session_start_time is None:
@@ -690,7 +1033,7 @@ class PomodoroModule:
         }
         
         # Add to today's sessions
-        today = date.today().isoformat()
+        today = self._today_key
         if 'days' not in self.stats:
             self.stats['days'] = {}
         if today not in self.stats['days']:
@@ -711,7 +1054,7 @@ class PomodoroModule:
     def reset_timer(self):
         """Reset timer to start of current session."""
         self.is_running = False
-        self._stop_timer = True
+        self._cancel_tick()
         self._session_start_time = None
         self.start_button.config(text="▶ Start")
         
@@ -728,26 +1071,27 @@ class PomodoroModule:
     def update_progress_indicator(self):
         """Update progress dots (●○○○)."""
         completed_in_set = self.pomodoros_completed % self.LONG_BREAK_INTERVAL
-        remaining = self.LONG_BREAK_INTERVAL - completed_in_set
-        indicator = "●" * completed_in_set + "○" * remaining
-        self.progress_label.config(text=indicator)
+        self._set_text(self.progress_var, self._indicator_cache[completed_in_set])
     
     def send_pomodoro_notification(self):
         """Send notification on completion."""
         try:
             from notification_manager import send_notification
             
-            focus_min = self.total_today * self.settings['work_minutes']
+            settings = self.settings
+            completed = self.pomodoros_completed
+            total = self.total_today
+            focus_min = total * settings['work_minutes']
             
             # Next session type
-            if self.pomodoros_completed % self.LONG_BREAK_INTERVAL == 0:
-                next_session = f"Long Break ({self.settings['long_break_minutes']} min)"
+            if completed % self.LONG_BREAK_INTERVAL == 0:
+                next_session = f"Long Break ({settings['long_break_minutes']} min)"
             else:
-                next_session = f"Short Break ({self.settings['short_break_minutes']} min)"
+                next_session = f"Short Break ({settings['short_break_minutes']} min)"
             
             send_notification(
-                title=f"🍅 Pomodoro #{self.pomodoros_completed} Complete!",
-                message=f"Task: {self.current_task}\n\nYou've completed {self.total_today}/{self.DAILY_GOAL} pomodoros today ({focus_min} minutes).\n\nTime for a {next_session}",
+                title=f"🍅 Pomodoro #{completed} Complete!",
+                message=f"Task: {self.current_task}\n\nYou've completed {total}/{self.DAILY_GOAL} pomodoros today ({focus_min} minutes).\n\nTime for a {next_session}",
                 module="Pomodoro",
                 notification_type="success",
                 actions=[
@@ -761,10 +1105,15 @@ class PomodoroModule:
     
     def show_stats_window(self):
         """Open statistics window with matplotlib chart."""
+        self._ensure_stats_loaded()
+        
+        # Only one stats window at a time; it shares the cached figure
+        if self._stats_window is not None and self._stats_window.winfo_exists():
+            self._stats_window.lift()
+            return
+        
         try:
-            import matplotlib.pyplot as plt
-            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-            from matplotlib.figure import Figure
+            Figure, FigureCanvasTkAgg = _load_matplotlib()
         except ImportError:
             messagebox.showerror(
                 "Matplotlib Required",
@@ -774,6 +1123,7 @@ class PomodoroModule:
         
         # Create stats window
         stats_window = tk.Toplevel(self.parent)
+        self._stats_window = stats_window
         stats_window.title("📊 Pomodoro Statistics")
         stats_window.geometry("800x600")
         stats_window.configure(bg=self.colors['content_bg'])
@@ -782,7 +1132,7 @@ class PomodoroModule:
         tk.Label(
             stats_window,
             text="📊 Pomodoro Statistics",
-            font=("Segoe UI", 16, "bold"),
+            font="PomoStatsTitle",
             bg=self.colors['content_bg'],
             fg=self.colors['text']
         ).pack(pady=20)
@@ -793,9 +1143,20 @@ class PomodoroModule:
         
         period_var = tk.StringVar(value="7")
 
-        # matplotlib figure (shared between bar chart and heatmap)
-        fig = Figure(figsize=(10, 5), facecolor=self.colors['content_bg'])
-        ax = fig.add_subplot(111, facecolor=self.colors['card_bg'])
+        # matplotlib figure, built and styled once and reused on every open;
+        # period switches only swap the bars
+        if self._stats_fig is None:
+            fig = Figure(figsize=(10, 5), facecolor=self.colors['content_bg'])
+            ax = fig.add_subplot(111, facecolor=self.colors['card_bg'])
+            ax.set_xlabel("Date", color=self.colors['text'], fontsize=11)
+            ax.set_ylabel("Pomodoros", color=self.colors['text'], fontsize=11)
+            ax.tick_params(colors=self.colors['text_dim'])
+            ax.spines['bottom'].set_color(self.colors['text_dim'])
+            ax.spines['left'].set_color(self.colors['text_dim'])
+            ax.spines['top'].set_visible(False)
+            ax.spines['right'].set_visible(False)
+            self._stats_fig = (fig, ax)
+        fig, ax = self._stats_fig
         canvas = FigureCanvasTkAgg(fig, master=stats_window)
 
         # heatmap tk canvas (shown instead of matplotlib for year view)
@@ -816,7 +1177,7 @@ class PomodoroModule:
             text="Last 7 Days",
             variable=period_var,
             value="7",
-            font=("Segoe UI", 10),
+            font="PomoSmall",
             bg=self.colors['content_bg'],
             fg=self.colors['text'],
             selectcolor=self.colors['card_bg'],
@@ -829,7 +1190,7 @@ class PomodoroModule:
             text="Last 30 Days",
             variable=period_var,
             value="30",
-            font=("Segoe UI", 10),
+            font="PomoSmall",
             bg=self.colors['content_bg'],
             fg=self.colors['text'],
             selectcolor=self.colors['card_bg'],
@@ -842,7 +1203,7 @@ class PomodoroModule:
             text="📅 Year View",
             variable=period_var,
             value="year",
-            font=("Segoe UI", 10),
+            font="PomoSmall",
             bg=self.colors['content_bg'],
             fg=self.colors['text'],
             selectcolor=self.colors['card_bg'],
@@ -858,7 +1219,7 @@ class PomodoroModule:
         tk.Button(
             stats_window,
             text="📥 Export CSV",
-            font=("Segoe UI", 11, "bold"),
+            font="PomoTextBold",
             bg=self.colors['accent'],
             fg="white",
             cursor="hand2",
@@ -870,62 +1231,86 @@ class PomodoroModule:
     
     def update_stats_chart(self, fig, ax, canvas, days):
         """Update the statistics chart."""
-        ax.clear()
-        
-        # Get data for period
         import datetime as dt
+        import numpy as np
         period = int(days)
         today = date.today()
-        dates = [(today - dt.timedelta(days=i)).isoformat() for i in range(period-1, -1, -1)]
+        counts = self._daily_counts(period)
+        
+        # Same period on the same day: the bars, ticks and title still fit,
+        # so only the heights need updating
+        if ax.containers and self._chart_key == (period, today):
+            for bar, count in zip(ax.containers[0], counts):
+                bar.set_height(count)
+            ax.relim()
+            ax.autoscale_view()
+            canvas.draw_idle()
+            return
+        self._chart_key = (period, today)
         
-        counts = []
-        for d in dates:
-            if 'days' in self.stats and d in self.stats['days']:
-                counts.append(self.stats['days'][d]['count'])
-            else:
-                counts.append(0)
+        # Remove the previous period's bars but keep the axes styling
+        for container in list(ax.containers):
+            container.remove()
+        
+        dates = [today - dt.timedelta(days=i) for i in range(period-1, -1, -1)]
         
         # Create bar chart
-        bars = ax.bar(range(len(dates)), counts, color=self.colors['accent'])
+        bars = ax.bar(np.arange(period), counts, color=self.colors['accent'])
         
         # Highlight today
         if len(bars) > 0:
             bars[-1].set_color(self.colors['success'])
         
-        # Styling
+        # Rescale to the new bars only
+        ax.relim()
+        ax.autoscale_view()
         ax.set_title(f"Pomodoros Completed - Last {days} Days", 
                     color=self.colors['text'], fontsize=14, fontweight='bold')
-        ax.set_xlabel("Date", color=self.colors['text'], fontsize=11)
-        ax.set_ylabel("Pomodoros", color=self.colors['text'], fontsize=11)
-        ax.tick_params(colors=self.colors['text_dim'])
-        ax.spines['bottom'].set_color(self.colors['text_dim'])
-        ax.spines['left'].set_color(self.colors['text_dim'])
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
         
         # X-axis labels (show fewer for 30 days)
         if period == 7:
-            labels = [dt.datetime.fromisoformat(d).strftime("%m/%d") for d in dates]
+            labels = [d.strftime("%m/%d") for d in dates]
             ax.set_xticks(range(len(dates)))
             ax.set_xticklabels(labels, rotation=45)
         else:
             # Show every 5th day for 30 days
             indices = list(range(0, len(dates), 5))
-            labels = [dt.datetime.fromisoformat(dates[i]).strftime("%m/%d") for i in indices]
+            labels = [dates[i].strftime("%m/%d") for i in indices]
             ax.set_xticks(indices)
             ax.set_xticklabels(labels, rotation=45)
         
         fig.tight_layout()
-        canvas.draw()
+        canvas.draw_idle()
+    
+    def _daily_counts(self, period):
+        """Return per-day pomodoro counts for the last `period` days, oldest first."""
+        import numpy as np
+        day_data = self.stats.get('days', {})
+        today = date.today()
+        
+        # Reuse the arrays until a session is recorded or the day rolls over
+        signature = (today, len(day_data), self.total_today)
+        if self._chart_cache is None or self._chart_cache[0] != signature:
+            self._chart_cache = (signature, {})
+        cached = self._chart_cache[1]
+        
+        counts = cached.get(period)
+        if counts is None:
+            counts = np.zeros(period, dtype=np.int32)
+            # Days are stored oldest-first: walk back from today and stop past the window
+            for key, entry in reversed(day_data.items()):
+                idx = (today - date.fromisoformat(key)).days
+                if idx >= period:
+                    break
+                if idx >= 0:
+                    counts[period - 1 - idx] = entry.get('count', 0)
+            cached[period] = counts
+        return counts
     
     def draw_heatmap(self, parent_frame):
         """Draw a GitHub-style contribution heatmap for the past 52 weeks."""
         import datetime as dt
-
-        # Clear previous heatmap widgets
-        for w in parent_frame.winfo_children():
-            try: w.destroy()
-            except: pass
+        import numpy as np
 
         today = date.today()
         # Start from Monday 52 weeks ago
@@ -935,14 +1320,64 @@ class PomodoroModule:
 
         CELL = 12   # px per cell
         GAP = 2     # gap between cells
+        STEP = CELL + GAP
         COLS = 53   # weeks
         ROWS = 7    # days per week (Mon=0 … Sun=6)
         LEFT_PAD = 28
         TOP_PAD = 20
         MONTH_H = 16
+        GRID_Y = MONTH_H + TOP_PAD
+
+        # Colour scale: 0 → dim, 1 → faded accent, 2-3 → accent, 4+ → bright
+        # (palette index 0 is the canvas background, used for gaps and future days)
+        empty = self.colors['content_bg']
+        accent = self.colors['accent']
+        bright = self.colors['success']
+        dim = self.colors.get('card_bg', '#334155')
+        faded = _blend(accent, empty, 0.55)
+        palette = np.array([empty, dim, faded, accent, bright])
+        level_lut = np.array([1, 2, 3, 3, 4], dtype=np.uint8)
+
+        # Aggregate counts into a (row, col) grid in one pass over the stats
+        # (day keys were validated at load, see _sort_and_prune_days)
+        counts = np.zeros((ROWS, COLS), dtype=np.int32)
+        for key, entry in reversed(self.stats.get('days', {}).items()):
+            offset = (date.fromisoformat(key) - start).days
+            if offset < 0:
+                break
+            if offset < ROWS * COLS:
+                counts[offset % 7, offset // 7] = entry.get('count', 0)
+        levels = level_lut[np.minimum(counts, 4)]
+        # Days after today stay blank
+        day_offsets = np.arange(COLS)[None, :] * 7 + np.arange(ROWS)[:, None]
+        levels[day_offsets > (today - start).days] = 0
 
-        canvas_w = LEFT_PAD + COLS * (CELL + GAP) + 10
-        canvas_h = MONTH_H + TOP_PAD + ROWS * (CELL + GAP) + 40
+        # Same frame and same day: repaint only the cells whose level changed
+        cached = self._heatmap
+        if (cached is not None and cached["frame"] is parent_frame
+                and cached["today"] == today and cached["canvas"].winfo_exists()):
+            photo = cached["photo"]
+            changed = np.nonzero(levels != cached["levels"])
+            if len(changed[0]) > self.HEATMAP_BULK_CELLS:
+                # Many changes: one full-image copy beats a Tcl call per cell
+                half = self._heatmap_image(levels, palette, STEP)
+                photo.tk.call(photo, "copy", half, "-zoom", 2, 2)
+            else:
+                for row, col in zip(*changed):
+                    x, y = col * STEP, row * STEP
+                    photo.put(palette[levels[row, col]], to=(x, y, x + CELL, y + CELL))
+            cached["levels"] = levels
+            # The tooltip reads this array, so update it in place
+            cached["counts"][...] = counts
+            return
+
+        # Clear previous heatmap widgets
+        for w in parent_frame.winfo_children():
+            try: w.destroy()
+            except: pass
+
+        canvas_w = LEFT_PAD + COLS * STEP + 10
+        canvas_h = GRID_Y + ROWS * STEP + 40
 
         cv = tk.Canvas(parent_frame, bg=self.colors['content_bg'],
                        highlightthickness=0, width=canvas_w, height=canvas_h)
@@ -950,100 +1385,103 @@ class PomodoroModule:
 
         # Title
         cv.create_text(canvas_w // 2, 10, text="Yearly Contribution Heatmap",
-                       font=("Segoe UI", 11, "bold"), fill=self.colors['text'], anchor="n")
+                       font="PomoTextBold", fill=self.colors['text'], anchor="n")
 
         # Day-of-week labels
         day_names = ["M", "", "W", "", "F", "", "S"]
         for r, name in enumerate(day_names):
-            y = MONTH_H + TOP_PAD + r * (CELL + GAP) + CELL // 2
+            y = GRID_Y + r * STEP + CELL // 2
             cv.create_text(LEFT_PAD - 6, y, text=name,
-                           font=("Segoe UI", 8), fill=self.colors['text_dim'], anchor="e")
+                           font="PomoTiny", fill=self.colors['text_dim'], anchor="e")
 
-        # Colour scale: 0 → background, 1 → dim accent, 2-3 → accent, 4+ → bright
-        bg = self.colors['background']
-        accent = self.colors['accent']
-        bright = self.colors['success']
-        dim = self.colors.get('card_bg', '#334155')
-
-        def cell_color(count):
-            if count == 0:   return dim
-            if count == 1:   return accent + "88"   # semi-transparent via hex may not work in tk
-            if count <= 3:   return accent
-            return bright
-
-        # Build data lookup
-        day_data = self.stats.get('days', {})
+        photo = self._heatmap_image(levels, palette, STEP).zoom(2)
+        # Keep a reference or Tk drops the image
+        cv.heat_photo = photo
+        cv.create_image(LEFT_PAD, GRID_Y, image=photo, anchor="nw")
+        self._heatmap = {"frame": parent_frame, "canvas": cv, "photo": photo,
+                         "today": today, "levels": levels, "counts": counts}
 
-        # Track months for labels
+        # Month labels above the first row
         last_month = None
-        tooltip_items = []
-
-        current = start
+        week = dt.timedelta(weeks=1)
+        d = start
         for col in range(COLS):
-            for row in range(ROWS):
-                d = current + dt.timedelta(days=row)
-                if d > today:
-                    current += dt.timedelta(weeks=1)
-                    break
-                count = day_data.get(d.isoformat(), {}).get('count', 0)
-                color = cell_color(count)
-
-                x1 = LEFT_PAD + col * (CELL + GAP)
-                y1 = MONTH_H + TOP_PAD + row * (CELL + GAP)
-                x2, y2 = x1 + CELL, y1 + CELL
-
-                rect_id = cv.create_rectangle(x1, y1, x2, y2, fill=color, outline="", tags="cell")
-
-                # Tooltip on hover
-                tip_text = f"{d.strftime('%a %b %d')} — {count} session{'s' if count != 1 else ''}"
-                tooltip_items.append((rect_id, tip_text))
-
-                # Month label at top of first row
-                if row == 0 and d.month != last_month:
-                    last_month = d.month
-                    cv.create_text(x1, MONTH_H + TOP_PAD - 4,
-                                   text=d.strftime("%b"), font=("Segoe UI", 8),
-                                   fill=self.colors['text_dim'], anchor="sw")
-
-            current += dt.timedelta(weeks=1)
+            if d > today:
+                break
+            if d.month != last_month:
+                last_month = d.month
+                cv.create_text(LEFT_PAD + col * STEP, GRID_Y - 4,
+                               text=d.strftime("%b"), font="PomoTiny",
+                               fill=self.colors['text_dim'], anchor="sw")
+            d += week
 
-        # Tooltip implementation
-        tip_win = [None]
+        # Tooltip: map the pointer back to a cell instead of binding every cell.
+        # One borderless window is created on first hover and then only moved,
+        # relabelled and shown/hidden.
+        tip = {"win": None, "label": None, "cell": None}
+        start_ordinal = start.toordinal()
 
-        def _show_tip(event, text):
-            if tip_win[0]:
-                try: tip_win[0].destroy()
-                except: pass
-            tw = tk.Toplevel(cv)
-            tw.wm_overrideredirect(True)
-            tw.wm_geometry(f"+{event.x_root + 12}+{event.y_root + 12}")
-            tk.Label(tw, text=text, font=("Segoe UI", 9),
-                     bg="#1E293B", fg="#E2E8F0", padx=6, pady=3, relief="solid", bd=1).pack()
-            tip_win[0] = tw
+        def _hide_tip(event=None):
+            if tip["cell"] is not None:
+                tip["cell"] = None
+                tip["win"].withdraw()
 
-        def _hide_tip(event):
-            if tip_win[0]:
-                try: tip_win[0].destroy()
-                except: pass
-            tip_win[0] = None
+        def _on_motion(event):
+            col, cx = divmod(event.x - LEFT_PAD, STEP)
+            row, cy = divmod(event.y - GRID_Y, STEP)
+            if not (0 <= col < COLS and 0 <= row < ROWS) or cx >= CELL or cy >= CELL:
+                _hide_tip()
+                return
+            d = date.fromordinal(start_ordinal + col * 7 + row)
+            if d > today:
+                _hide_tip()
+                return
+            if tip["cell"] == (col, row):
+                return
+            if tip["win"] is None:
+                tw = tk.Toplevel(cv)
+                tw.wm_overrideredirect(True)
+                tip["label"] = tk.Label(tw, font="PomoTooltip", bg="#1E293B", fg="#E2E8F0",
+                                        padx=6, pady=3, relief="solid", bd=1)
+                tip["label"].pack()
+                tip["win"] = tw
+            count = int(counts[row, col])
+            tip["label"].config(text=f"{d.strftime('%a %b %d')} — {count} session{'s' if count != 1 else ''}")
+            tip["win"].wm_geometry(f"+{event.x_root + 12}+{event.y_root + 12}")
+            tip["win"].deiconify()
+            tip["cell"] = (col, row)
 
-        for rect_id, tip_text in tooltip_items:
-            cv.tag_bind(rect_id, "<Enter>", lambda e, t=tip_text: _show_tip(e, t))
-            cv.tag_bind(rect_id, "<Leave>", _hide_tip)
+        cv.bind("<Motion>", _on_motion)
+        cv.bind("<Leave>", _hide_tip)
 
         # Legend
-        legend_y = MONTH_H + TOP_PAD + ROWS * (CELL + GAP) + 8
-        cv.create_text(LEFT_PAD, legend_y, text="Less", font=("Segoe UI", 8),
+        legend_y = GRID_Y + ROWS * STEP + 8
+        cv.create_text(LEFT_PAD, legend_y, text="Less", font="PomoTiny",
                        fill=self.colors['text_dim'], anchor="w")
-        for i, col in enumerate([dim, accent, bright]):
-            lx = LEFT_PAD + 32 + i * (CELL + GAP)
+        for i, col in enumerate([dim, faded, accent, bright]):
+            lx = LEFT_PAD + 32 + i * STEP
             cv.create_rectangle(lx, legend_y - 1, lx + CELL, legend_y + CELL - 1,
                                 fill=col, outline="")
-        cv.create_text(LEFT_PAD + 32 + 3 * (CELL + GAP) + 4, legend_y, text="More",
-                       font=("Segoe UI", 8), fill=self.colors['text_dim'], anchor="w")
+        cv.create_text(LEFT_PAD + 32 + 4 * STEP + 4, legend_y, text="More",
+                       font="PomoTiny", fill=self.colors['text_dim'], anchor="w")
 
+    def _heatmap_image(self, levels, palette, step):
+        """Rasterise heatmap levels at half resolution (cell and gap halved) into a PhotoImage."""
+        import numpy as np
+        unit = step // 2
+        pixels = np.repeat(np.repeat(levels, unit, axis=0), unit, axis=1)
+        pixels[unit - 1::unit, :] = 0
+        pixels[:, unit - 1::unit] = 0
+        pixels = pixels[:-1, :-1]
+        rows = palette[pixels]
+        image = tk.PhotoImage(width=pixels.shape[1], height=pixels.shape[0])
+        image.put(" ".join("{" + " ".join(row) + "}" for row in rows))
+        return image
+    
     def export_csv(self):
         """Export session history to CSV."""
+        self._ensure_stats_loaded()
+        
         filename = filedialog.asksaveasfilename(
             defaultextension=".csv",
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
@@ -1054,22 +1492,24 @@ class PomodoroModule:
             return
         
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
+            days = self.stats.get('days', {})
+            # Stream every session straight into the writer, oldest day first
+            rows = (
+                (
+                    day,
+                    session['started_at'],
+                    session['completed_at'],
+                    session['duration_minutes'],
+                    session.get('task_label', 'Focus session')
+                )
+                for day in sorted(days)
+                for session in days[day].get('sessions', [])
+            )
+            
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
                 writer = csv.writer(f)
                 writer.writerow(['Date', 'Start Time', 'End Time', 'Duration (min)', 'Task'])
-                
-                # Export all sessions
-                if 'days' in self.stats:
-                    for day in sorted(self.stats['days'].keys()):
-                        day_data = self.stats['days'][day]
-                        for session in day_data.get('sessions', []):
-                            writer.writerow([
-                                day,
-                                session['started_at'],
-                                session['completed_at'],
-                                session['duration_minutes'],
-                                session.get('task_label', 'Focus session')
-                            ])
+                writer.writerows(rows)
             
             messagebox.showinfo("Export Complete", f"Statistics exported to:\n{filename}")
         
@@ -1078,49 +1518,67 @@ class PomodoroModule:
     
     def get_today_count(self):
         """Get today's pomodoro count."""
-        today = date.today().isoformat()
-        if 'days' in self.stats and today in self.stats['days']:
-            return self.stats['days'][today]['count']
-        return 0
+        return self.stats.get('days', {}).get(self._today_key, {}).get('count', 0)
     
     def load_stats(self):
+        """Return the shared stats dict, reading the file on first use in this process."""
+        global _STATS_CACHE
+        with _STATS_LOCK:
+            if _STATS_CACHE is None:
+                _STATS_CACHE = self._read_stats_file()
+                self._sort_and_prune_days(_STATS_CACHE)
+            return _STATS_CACHE
+    
+    def _sort_and_prune_days(self, stats):
+        """Order days oldest-first and drop any beyond POMODORO_HISTORY_DAYS (0 keeps all)."""
+        # Drop malformed (e.g. hand-edited) days here so the chart and heatmap
+        # loops can parse every key without checking
+        days = sorted(item for item in stats.get('days', {}).items() if _is_day_entry(*item))
+        try:
+            import config
+            keep_days = getattr(config, 'POMODORO_HISTORY_DAYS', 0)
+        except ImportError:
+            keep_days = 0
+        if keep_days > 0:
+            cutoff = (date.today() - timedelta(days=keep_days)).isoformat()
+            days = [item for item in days if item[0] > cutoff]
+        # Plain dicts keep insertion order, so recent-window scans can walk backwards
+        stats['days'] = dict(days)
+    
+    def _read_stats_file(self):
         """Load stats with backward-compatible migration from v1."""
-        stats_file = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            "data",
-            "pomodoro_stats.json"
-        )
+        stats_file = _STATS_PATH
         
         try:
-            if os.path.exists(stats_file):
-                with open(stats_file, 'r') as f:
-                    stats = json.load(f)
-                
-                # Check for v2 format
-                if 'version' in stats:
-                    return stats
-                
-                # Migrate v1 format: {"2026-02-10": 3}
-                new_stats = {
-                    "version": 2,
-                    "settings": self.get_settings(None),  # Pass None since no stats yet
-                    "days": {}
-                }
-                
-                for day, count in stats.items():
-                    if day.count('-') == 2:  # Valid date format
-                        new_stats['days'][day] = {
-                            "count": count,
-                            "goal": 8,  # Default goal
-                            "sessions": []
-                        }
-                
-                # Save migrated version
-                with open(stats_file, 'w') as f:
-                    json.dump(new_stats, f, indent=2)
-                
-                print("✅ Migrated pomodoro stats from v1 to v2")
-                return new_stats
+            # A missing file raises IOError and falls through to a fresh v2 dict
+            with open(stats_file, 'rb') as f:
+                stats = _loads(f.read())
+            
+            # Check for v2 format
+            if 'version' in stats:
+                return stats
+            
+            # Migrate v1 format: {"2026-02-10": 3}
+            new_stats = {
+                "version": 2,
+                "settings": self.get_settings(None),  # Pass None since no stats yet
+                "days": {}
+            }
+            
+            for day, count in stats.items():
+                if day.count('-') == 2:  # Valid date format
+                    new_stats['days'][day] = {
+                        "count": count,
+                        "goal": 8,  # Default goal
+                        "sessions": []
+                    }
+            
+            # Save migrated version
+            with open(stats_file, 'wb') as f:
+                f.write(_dumps(new_stats))
+            
+            print("✅ Migrated pomodoro stats from v1 to v2")
+            return new_stats
         
         except (json.JSONDecodeError, IOError):
             pass
@@ -1133,20 +1591,19 @@ class PomodoroModule:
         }
     
     def save_stats(self):
-        """Save stats to file."""
-        stats_file = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            "data",
-            "pomodoro_stats.json"
-        )
-        
-        try:
-            # Ensure data directory exists
-            os.makedirs(os.path.dirname(stats_file), exist_ok=True)
-            
-            # Save
-            with open(stats_file, 'w') as f:
-                json.dump(self.stats, f, indent=2)
-        
-        except IOError as e:
-            print(f"Error saving pomodoro stats: {e}")
+        """Mark stats dirty and schedule one write after the debounce window."""
+        self._stats_dirty = True
+        if self._save_after_id is None:
+            self._save_after_id = self.parent.after(self.STATS_SAVE_DELAY_MS, self._flush_stats)
+    
+    def _flush_stats(self, wait=False):
+        """Serialize stats on the UI thread and hand the write to the stats worker."""
+        self._save_after_id = None
+        if self._stats_dirty:
+            self._stats_dirty = False
+            # The bytes are a snapshot, so the worker never touches the live dict
+            _post_stats_job(partial(_write_stats_file, _dumps(self.stats)))
+        
+        # Teardown/exit: block until every queued write has landed
+        if wait:
+            _STATS_QUEUE.join()
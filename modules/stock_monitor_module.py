@@ -20,12 +20,92 @@ Requires:
 import tkinter as tk
 from tkinter import messagebox
 from tkinter import scrolledtext # Standard PyInstaller hook target
-import yfinance as yf
-import matplotlib.pyplot as plt
-import json
+import hashlib
+import importlib.util
 import os
+import re
 from datetime import datetime
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from json_utils import dumps as _dumps, loads as _loads
+
+
+# Plausible Yahoo symbols (e.g. VTI, BRK.B, 0700.HK, RELIANCE.NS, ^GSPC, BTC-USD,
+# EURUSD=X); anything else is a typo
+_TICKER_RE = re.compile(r'^\^?[A-Z0-9][A-Z0-9.\-=]{0,19}$')
+
+# Alert types in the order of their codes in the vectorized check, and their notifications
+_ALERT_TYPES = ('above', 'below', 'pct_up', 'pct_down')
+_ALERT_CODES = {t: i for i, t in enumerate(_ALERT_TYPES)}
+_ALERT_MESSAGES = {
+    'above': "{ticker} hit ${price:.2f} (alert: above ${threshold:.2f})",
+    'below': "{ticker} hit ${price:.2f} (alert: below ${threshold:.2f})",
+    'pct_up': "{ticker} up {pct:.2f}% today (alert: ≥ +{threshold:.2f}%)",
+    'pct_down': "{ticker} down {drop:.2f}% today (alert: ≤ −{threshold:.2f}%)",
+}
+
+# Card arrow and color key by sign of the price change
+_ARROWS = {1: "▲", -1: "▼", 0: "━"}
+_CHANGE_COLOR_KEYS = {1: 'success', -1: 'danger', 0: 'text_dim'}
+
+# Options shared by the action buttons on every stock card
+_CARD_BUTTON = {'font': ("Segoe UI", 9), 'cursor': "hand2", 'pady': 3}
+
+
+def _price_changes(histories):
+    """Map ticker -> (price, change, change_pct) for every non-empty (dates, closes) history."""
+    import numpy as np
+    tickers = list(histories)
+    # Last two valid closes per ticker as the rows of one (2, N) matrix; short
+    # histories leave NaN in the previous-close row
+    tails = np.full((2, len(tickers)), np.nan)
+    for col, ticker in enumerate(tickers):
+        closes = histories[ticker][1]
+        closes = closes[~np.isnan(closes)][-2:]
+        if len(closes):
+            tails[2 - len(closes):, col] = closes
+    
+    prev, prices = tails
+    # A missing previous close means no change rather than NaN
+    prev = np.where(np.isnan(prev), prices, prev)
+    changes = prices - prev
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pcts = np.where(prev > 0, changes / prev * 100.0, 0.0)
+    
+    valid = ~np.isnan(prices)
+    return {
+        ticker: (float(p), float(c), float(pc))
+        for ticker, p, c, pc in zip(
+            np.array(tickers, dtype=object)[valid], prices[valid], changes[valid], pcts[valid]
+        )
+    }
+
+
+def _close_arrays(hist):
+    """Reduce a fetched DataFrame to the (dates, closes) arrays the module keeps."""
+    import numpy as np
+    if hist.empty:
+        return np.empty(0, dtype='datetime64[ns]'), np.empty(0)
+    # Dropping the exchange timezone keeps dates as datetime64 rather than Timestamp objects.
+    # Closes stay float64: alert thresholds compare against them exactly
+    dates = hist.index.tz_localize(None).to_numpy(dtype='datetime64[ns]')
+    return dates, hist['Close'].to_numpy(dtype=np.float64)
+
+
+def _digest(payload):
+    """Short fingerprint of serialized data, to tell whether a file needs rewriting."""
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _write_atomic(path, payload):
+    """Write bytes to a temp file and swap it in, so a crash never leaves half a file."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
 
 
 class StockMonitorModule:
@@ -36,6 +116,22 @@ class StockMonitorModule:
     """
     ICON = "📈"
     PRIORITY = 4  
+    
+    # Seconds a fetched price history is reused before hitting Yahoo again
+    HISTORY_TTL = 60
+    # Most (ticker, period) histories kept in memory; least recently used go first
+    HISTORY_CACHE_SIZE = 256
+    # Seconds a history saved to disk is still loaded after a restart
+    DISK_CACHE_TTL = 24 * 60 * 60
+    # History window shown by Plot, and how long it is reused before refetching
+    PLOT_PERIOD = '6mo'
+    PLOT_HISTORY_TTL = 60 * 60
+    # Delay that coalesces bursts of watchlist/alert changes into one write
+    SAVE_DELAY_MS = 500
+    # Symbols per yf.download request when refreshing the whole watchlist
+    DOWNLOAD_BATCH_SIZE = 20
+    # Concurrent Yahoo requests across adds, refreshes and chart fetches
+    FETCH_WORKERS = 8
 
     def __init__(self, parent_frame, colors):
         """
@@ -49,12 +145,22 @@ class StockMonitorModule:
         self.colors = colors
         
         # Watchlist storage
-        self.watchlist = {}  # {ticker: {price, change, change_pct, last_updated, data}}
+        self.watchlist = {}  # {ticker: {price, change, change_pct, last_updated}} (saved as-is)
+        self._history = {}   # {ticker: (dates, closes)} arrays from the last fetch (runtime only)
+        self._cards = {}     # {ticker: {frame, price_lbl, change_lbl, time_lbl}} on screen
+        self._empty_label = None
+        self._redraw_pending = False
         self.watchlist_file = os.path.join(
             os.path.dirname(os.path.dirname(__file__)),
             "data",
             "stock_watchlist.json"
         )
+        # Latest 2-day bars per ticker, so reopening doesn't need the network
+        self.bars_file = os.path.join(
+            os.path.dirname(os.path.dirname(__file__)),
+            "data",
+            "stock_watchlist_bars.npz"
+        )
         # Alerts storage  {ticker: [{type, threshold, triggered, created_at}, ...]}
         self.alerts_file = os.path.join(
             os.path.dirname(os.path.dirname(__file__)),
@@ -62,6 +168,35 @@ class StockMonitorModule:
             "stock_alerts.json"
         )
         self.alerts = {}
+        self._active_alerts = None  # {ticker: [untriggered alert, ...]}, see _pending_alerts()
+
+        # Pending debounced saves (after ids)
+        self._save_job = None
+        self._alerts_save_job = None
+        # Fingerprint of what each JSON file last held, to skip no-op writes
+        self._saved_digests = {}
+
+        # Recent price histories in LRU order: {(ticker, period): (monotonic time, (dates, closes))}
+        self._history_cache = OrderedDict()
+        # Fetches store from pool threads, so the LRU bookkeeping is guarded
+        self._history_lock = threading.Lock()
+        # Chart histories per ticker, kept on disk between sessions
+        self.cache_dir = os.path.join(
+            os.path.dirname(os.path.dirname(__file__)),
+            "data",
+            "stock_cache"
+        )
+
+        # yf.Ticker objects by symbol, reused so per-ticker metadata is looked up once
+        self._tickers = {}
+
+        # Shared workers for every network fetch; shut down with the module
+        self._pool = ThreadPoolExecutor(max_workers=self.FETCH_WORKERS,
+                                        thread_name_prefix="stock-fetch")
+
+        # Embedded chart per ticker, reused across Plot clicks
+        # {ticker: {window, figure, ax, canvas, series}}
+        self._plot_windows = {}
 
         # Load saved watchlist and alerts
         self.load_watchlist()
@@ -70,10 +205,24 @@ class StockMonitorModule:
         # Create the user interface
         self.create_ui()
         
-        # Auto-refresh watchlist on load
-        if self.watchlist:
+        # Stop fetching once the module's widgets go away
+        self.status_label.bind("<Destroy>", self._on_destroy, add="+")
+        
+        # Auto-refresh watchlist on load, unless every history on disk is still fresh
+        if any(self._cached_history(t) is None for t in self._fetchable_tickers()):
             self.refresh_all_stocks()
 
+    def _on_destroy(self, event=None):
+        """Write pending saves and release the fetch workers when the module is torn down."""
+        self.canvas.unbind_all("<MouseWheel>")
+        if self._save_job is not None:
+            self._flush_save()
+        if self._alerts_save_job is not None:
+            self._flush_alerts_save()
+        
+        # Queued fetches are dropped; ones in flight finish and find the UI gone
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
     def create_ui(self):
         """Create the user interface"""
         # Title
@@ -140,7 +289,7 @@ class StockMonitorModule:
             bg=self.colors['card_bg'],
             fg=self.colors['text'],
             cursor="hand2",
-            command=self.refresh_all_stocks,
+            command=lambda: self.refresh_all_stocks(ttl=0),
             padx=20,
             pady=5
         ).pack(side=tk.LEFT, padx=5)
@@ -186,10 +335,10 @@ class StockMonitorModule:
         )
         self.scrollable_frame = tk.Frame(self.canvas, bg=self.colors['content_bg'])
         
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        # Resizes come in bursts while cards are packed; settle them once idle
+        self._scrollregion_pending = False
+        self._last_bbox = None
+        self.scrollable_frame.bind("<Configure>", self._schedule_scrollregion)
         
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor=tk.NW)
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
@@ -197,8 +346,10 @@ class StockMonitorModule:
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Bind mousewheel
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        # Bind mousewheel only while the pointer is over the watchlist, so wheel
+        # events elsewhere (or in other modules) don't reach this handler
+        self.watchlist_frame.bind("<Enter>", self._bind_mousewheel)
+        self.watchlist_frame.bind("<Leave>", self._unbind_mousewheel)
         
         # Display watchlist
         self.display_watchlist()
@@ -213,6 +364,32 @@ class StockMonitorModule:
         )
         self.status_label.pack(pady=10)
     
+    def _schedule_scrollregion(self, event=None):
+        if not self._scrollregion_pending:
+            self._scrollregion_pending = True
+            self.canvas.after_idle(self._refresh_scrollregion)
+    
+    def _refresh_scrollregion(self):
+        """Fit the scroll region to the cards, skipping the update if it hasn't changed."""
+        self._scrollregion_pending = False
+        bbox = self.canvas.bbox("all")
+        if bbox != self._last_bbox:
+            self._last_bbox = bbox
+            self.canvas.configure(scrollregion=bbox)
+    
+    def _bind_mousewheel(self, event=None):
+        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+    
+    def _unbind_mousewheel(self, event=None):
+        # Moving onto a card also sends <Leave>; keep scrolling while still inside
+        if event is not None:
+            frame = self.watchlist_frame
+            x = event.x_root - frame.winfo_rootx()
+            y = event.y_root - frame.winfo_rooty()
+            if 0 <= x < frame.winfo_width() and 0 <= y < frame.winfo_height():
+                return
+        self.canvas.unbind_all("<MouseWheel>")
+    
     def _on_mousewheel(self, event):
         try:
             # Check if canvas still exists before scrolling
@@ -229,53 +406,66 @@ class StockMonitorModule:
             messagebox.showwarning("Input Required", "Please enter a stock ticker!")
             return
         
+        if not _TICKER_RE.match(ticker):
+            messagebox.showwarning("Invalid Ticker", f"'{ticker}' doesn't look like a stock ticker.")
+            return
+        
         if ticker in self.watchlist:
             messagebox.showinfo("Already Tracked", f"{ticker} is already in your watchlist!")
             return
         
+        if self._yfinance_missing():
+            return
+        
         # Show loading
         self.status_label.config(text=f"Adding {ticker}...", fg=self.colors['accent'])
-        self.parent.update()
         
-        # Fetch initial data
+        # Fetch on the worker pool; the result is applied on the main thread
+        def _fetch():
+            try:
+                hist, error = self._get_history(ticker), None  # Get 2 days to calculate change
+            except Exception as e:
+                hist, error = None, e
+            self.parent.after(0, lambda: self._finish_add(ticker, hist, error))
+        
+        self._pool.submit(_fetch)
+    
+    def _finish_add(self, ticker, hist, error):
+        """Add a stock once its initial history has been fetched."""
+        # The module may have been closed, or the ticker added twice meanwhile
+        if ticker in self.watchlist or not self.status_label.winfo_exists():
+            return
+        
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period='2d')  # Get 2 days to calculate change
+            if error is not None:
+                raise error
             
-            if hist.empty:
+            if not len(hist[1]):
                 messagebox.showerror("Invalid Ticker", f"Could not find stock: {ticker}")
                 self.status_label.config(text="")
                 return
             
             # Get current price and calculate change
-            current_price = hist['Close'].iloc[-1]
-            
-            # Calculate change
-            if len(hist) > 1:
-                prev_price = hist['Close'].iloc[-2]
-                change = current_price - prev_price
-                change_pct = (change / prev_price) * 100
-            else:
-                change = 0
-                change_pct = 0
+            current_price, change, change_pct = _price_changes({ticker: hist})[ticker]
             
             # Add to watchlist
             self.watchlist[ticker] = {
-                'price': float(current_price),
-                'change': float(change),
-                'change_pct': float(change_pct),
-                'last_updated': datetime.now().isoformat(),
-                'data': hist
+                'price': current_price,
+                'change': change,
+                'change_pct': change_pct,
+                'last_updated': datetime.now().isoformat()
             }
+            self._history[ticker] = hist
             
             # Save watchlist
-            self.save_watchlist()
+            self._schedule_save()
             
-            # Clear input
-            self.ticker_entry.delete(0, tk.END)
+            # Clear input, unless another ticker was typed meanwhile
+            if self.ticker_entry.get().strip().upper() == ticker:
+                self.ticker_entry.delete(0, tk.END)
             
             # Refresh display
-            self.display_watchlist()
+            self._schedule_redraw()
             
             # Send notification
             self.send_notification(
@@ -293,12 +483,214 @@ class StockMonitorModule:
             messagebox.showerror("Error", f"Failed to add {ticker}: {str(e)}")
             self.status_label.config(text="")
     
+    def _yfinance_missing(self):
+        """Show install instructions if yfinance isn't available (checked without importing it)."""
+        if importlib.util.find_spec('yfinance') is not None:
+            return False
+        self.status_label.config(
+            text="✗ yfinance is not installed. Run: pip install yfinance",
+            fg=self.colors['danger']
+        )
+        return True
+    
+    def _fetchable_tickers(self):
+        """Watchlist symbols worth asking Yahoo about (malformed ones are skipped)."""
+        return [t for t in self.watchlist if _TICKER_RE.match(t)]
+    
+    def _cached_history(self, ticker, period='2d', ttl=None):
+        """Return a cached history younger than ttl (default HISTORY_TTL) seconds, else None."""
+        if ttl is None:
+            ttl = self.HISTORY_TTL
+        key = (ticker, period)
+        with self._history_lock:
+            cached = self._history_cache.get(key)
+            if cached is None or time.monotonic() - cached[0] >= ttl:
+                return None
+            self._history_cache.move_to_end(key)
+        return cached[1]
+    
+    def _cache_history(self, ticker, period, stamp, hist):
+        """Put a history in the in-memory cache, evicting the least recently used past HISTORY_CACHE_SIZE."""
+        key = (ticker, period)
+        with self._history_lock:
+            self._history_cache[key] = (stamp, hist)
+            self._history_cache.move_to_end(key)
+            while len(self._history_cache) > self.HISTORY_CACHE_SIZE:
+                self._history_cache.popitem(last=False)
+    
+    def _forget_history(self, ticker):
+        """Drop every cached period of a ticker's history."""
+        with self._history_lock:
+            for key in [k for k in self._history_cache if k[0] == ticker]:
+                del self._history_cache[key]
+    
+    def _get_history(self, ticker, period='2d', ttl=None):
+        """Fetch price history, reusing a result younger than ttl (default HISTORY_TTL) seconds."""
+        hist = self._cached_history(ticker, period, ttl)
+        if hist is not None:
+            return hist
+        
+        now = time.monotonic()
+        # Price bars only; dividend/split columns are never shown
+        hist = _close_arrays(self._get_ticker(ticker).history(period=period, actions=False))
+        self._store_history(ticker, period, now, hist)
+        return hist
+    
+    def _get_ticker(self, ticker):
+        """Return the yf.Ticker for a symbol, reusing the one built on an earlier fetch."""
+        # Imported on first fetch: yfinance pulls in pandas/numpy/requests,
+        # which would otherwise load at app startup even if this tab is never opened
+        import yfinance as yf
+        obj = self._tickers.get(ticker)
+        if obj is None:
+            obj = self._tickers[ticker] = yf.Ticker(ticker)
+        return obj
+    
+    def _history_path(self, ticker, period):
+        """Disk cache file for a ticker's history over period."""
+        return os.path.join(self.cache_dir, f"{ticker}_{period}.npz")
+    
+    def _store_history(self, ticker, period, stamp, hist):
+        """Cache a fetched (dates, closes) history in memory, and chart histories on disk."""
+        self._cache_history(ticker, period, stamp, hist)
+        dates, closes = hist
+        # 2-day bars are saved with the watchlist, see save_watchlist()
+        if period == '2d' or not len(closes):
+            return
+        import numpy as np
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._history_path(ticker, period)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, dates=dates, closes=closes)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"Error caching {ticker} history: {e}")
+    
+    def _read_history_file(self, ticker, period, max_age):
+        """Load a disk-cached history younger than max_age seconds into the cache."""
+        import numpy as np
+        path = self._history_path(ticker, period)
+        try:
+            age = time.time() - os.path.getmtime(path)
+            if age > max_age:
+                return None
+            with np.load(path) as npz:
+                hist = (npz['dates'], npz['closes'])
+        except Exception:
+            return None  # Missing or unreadable; fetched from Yahoo instead
+        # Backdate the entry so the in-memory TTL still counts from the original fetch
+        self._cache_history(ticker, period, time.monotonic() - age, hist)
+        return hist
+    
+    def _save_bars(self):
+        """Write every ticker's 2-day bars, with fetch times, to the watchlist's .npz sidecar."""
+        bars = {}
+        wall_now = time.time()
+        now = time.monotonic()
+        for ticker in self.watchlist:
+            cached = self._history_cache.get((ticker, '2d'))
+            if cached is None or not len(cached[1][1]):
+                continue
+            stamp, (dates, closes) = cached
+            bars[f"{ticker}_d"] = dates
+            bars[f"{ticker}_c"] = closes
+            bars[f"{ticker}_t"] = wall_now - (now - stamp)
+        if not bars:
+            return  # Nothing fetched yet (numpy may not even be installed)
+        
+        import numpy as np
+        tmp_path = self.bars_file + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez_compressed(f, **bars)
+        os.replace(tmp_path, self.bars_file)
+    
+    def _load_history_cache(self):
+        """Seed the history cache from the bars sidecar so startup can skip the network."""
+        if not os.path.exists(self.bars_file):
+            return
+        import numpy as np
+        wall_now = time.time()
+        now = time.monotonic()
+        try:
+            with np.load(self.bars_file) as npz:
+                names = set(npz.files)
+                for ticker in self.watchlist:
+                    if f"{ticker}_c" not in names:
+                        continue
+                    age = wall_now - float(npz[f"{ticker}_t"])
+                    if age > self.DISK_CACHE_TTL:
+                        continue
+                    hist = (npz[f"{ticker}_d"], npz[f"{ticker}_c"])
+                    # Backdate the entry so HISTORY_TTL still counts from the original fetch
+                    self._cache_history(ticker, '2d', now - age, hist)
+                    self._history[ticker] = hist
+        except Exception as e:
+            print(f"Error loading cached prices: {e}")
+    
+    def _download_batch(self, batch, period='2d'):
+        """Fetch histories for a batch of tickers with one yf.download request."""
+        import yfinance as yf
+        now = time.monotonic()
+        df = yf.download(batch, period=period, group_by='ticker', threads=True,
+                         progress=False, auto_adjust=True, actions=False)
+        
+        # Columns are (ticker, field) pairs unless yfinance flattened a single ticker
+        multi = getattr(df.columns, 'nlevels', 1) > 1
+        histories = {}
+        for ticker in batch:
+            if multi and ticker not in df.columns.get_level_values(0):
+                continue
+            hist = _close_arrays((df[ticker] if multi else df).dropna(how='all'))
+            # yfinance reports a failed symbol as an empty/all-NaN column, not an error
+            if not len(hist[1]):
+                continue
+            self._store_history(ticker, period, now, hist)
+            histories[ticker] = hist
+        return histories
+    
+    def _download_histories(self, tickers, period='2d'):
+        """Fetch histories for many tickers, running the batch downloads concurrently."""
+        histories = {}
+        if not tickers:
+            return histories
+        
+        batches = [tickers[i:i + self.DOWNLOAD_BATCH_SIZE]
+                   for i in range(0, len(tickers), self.DOWNLOAD_BATCH_SIZE)]
+        futures = [self._pool.submit(self._download_batch, batch, period) for batch in batches]
+        for future in as_completed(futures):
+            try:
+                histories.update(future.result())
+            except Exception:
+                pass  # Retried per ticker below
+        
+        # Tickers a batch failed on or returned no bars for fall back to individual requests
+        missing = [t for t in tickers if not len(histories.get(t, ((), ()))[1])]
+        futures = {self._pool.submit(self._get_history, t, period, 0): t for t in missing}
+        for future in as_completed(futures):
+            try:
+                histories[futures[future]] = future.result()
+            except Exception:
+                pass  # Skip failed tickers
+        return histories
+    
     def remove_from_watchlist(self, ticker):
         """Remove a stock from the watchlist"""
         if ticker in self.watchlist:
             del self.watchlist[ticker]
-            self.save_watchlist()
-            self.display_watchlist()
+            self._history.pop(ticker, None)
+            self._forget_history(ticker)
+            self._tickers.pop(ticker, None)
+            plot = self._plot_windows.pop(ticker, None)
+            if plot is not None and plot['window'].winfo_exists():
+                plot['window'].destroy()
+            try:
+                os.remove(self._history_path(ticker, self.PLOT_PERIOD))
+            except OSError:
+                pass
+            self._schedule_save()
+            self._schedule_redraw()
             
             self.status_label.config(
                 text=f"✓ {ticker} removed from watchlist",
@@ -307,150 +699,190 @@ class StockMonitorModule:
     
     def refresh_stock(self, ticker):
         """Refresh data for a single stock"""
-        if ticker not in self.watchlist:
+        if ticker not in self.watchlist or self._yfinance_missing():
             return
         
         self.status_label.config(text=f"Refreshing {ticker}...", fg=self.colors['accent'])
-        self.parent.update()
         
-        try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period='2d')
-            
-            if not hist.empty:
-                current_price = hist['Close'].iloc[-1]
-                
-                # Calculate change
-                if len(hist) > 1:
-                    prev_price = hist['Close'].iloc[-2]
-                    change = current_price - prev_price
-                    change_pct = (change / prev_price) * 100
-                else:
-                    change = 0
-                    change_pct = 0
-                
-                # Update watchlist
-                self.watchlist[ticker]['price'] = float(current_price)
-                self.watchlist[ticker]['change'] = float(change)
-                self.watchlist[ticker]['change_pct'] = float(change_pct)
-                self.watchlist[ticker]['last_updated'] = datetime.now().isoformat()
-                self.watchlist[ticker]['data'] = hist
-                
-                self.save_watchlist()
-                self.check_alerts(ticker, float(current_price))
-                self.display_watchlist()
-
-                self.status_label.config(
-                    text=f"✓ {ticker} refreshed: ${current_price:.2f}",
-                    fg=self.colors['success']
-                )
-        except Exception as e:
+        # Fetch on the worker pool; the result is applied on the main thread
+        def _fetch():
+            try:
+                hist = self._get_history(ticker, ttl=0)  # Explicit refresh skips the cache
+            except Exception:
+                hist = None
+            self.parent.after(0, lambda: self._finish_refresh(ticker, hist))
+        
+        self._pool.submit(_fetch)
+    
+    def _finish_refresh(self, ticker, hist):
+        """Apply a single-stock refresh once its history has been fetched."""
+        # The module may have been closed or the ticker removed meanwhile
+        if ticker not in self.watchlist or not self.status_label.winfo_exists():
+            return
+        
+        if hist is None:
             self.status_label.config(
                 text=f"✗ Failed to refresh {ticker}",
                 fg=self.colors['danger']
             )
+            return
+        
+        if len(hist[1]):
+            current_price, change, change_pct = _price_changes({ticker: hist})[ticker]
+            
+            # Update watchlist
+            self.watchlist[ticker]['price'] = current_price
+            self.watchlist[ticker]['change'] = change
+            self.watchlist[ticker]['change_pct'] = change_pct
+            self.watchlist[ticker]['last_updated'] = datetime.now().isoformat()
+            self._history[ticker] = hist
+            
+            self._schedule_save()
+            self.check_alerts([ticker])
+            self._schedule_redraw()
+
+            self.status_label.config(
+                text=f"✓ {ticker} refreshed: ${current_price:.2f}",
+                fg=self.colors['success']
+            )
     
-    def refresh_all_stocks(self):
-        """Refresh all stocks in watchlist"""
+    def refresh_all_stocks(self, ttl=None):
+        """Refresh all stocks in watchlist (ttl=0 bypasses the history cache)"""
         if not self.watchlist:
             messagebox.showinfo("Empty Watchlist", "Add some stocks to your watchlist first!")
             return
         
+        if self._yfinance_missing():
+            return
+        
         self.status_label.config(text="Refreshing all stocks...", fg=self.colors['accent'])
-        self.parent.update()
         
-        # Refresh in background thread
+        tickers = self._fetchable_tickers()
+        
+        # Refresh in a separate thread: it waits on the worker pool, so running
+        # it on a pool thread could starve the fetches it submits
         def _refresh():
-            for ticker in list(self.watchlist.keys()):
-                try:
-                    stock = yf.Ticker(ticker)
-                    hist = stock.history(period='2d')
-                    
-                    if not hist.empty:
-                        current_price = hist['Close'].iloc[-1]
-                        
-                        if len(hist) > 1:
-                            prev_price = hist['Close'].iloc[-2]
-                            change = current_price - prev_price
-                            change_pct = (change / prev_price) * 100
-                        else:
-                            change = 0
-                            change_pct = 0
-                        
-                        self.watchlist[ticker]['price'] = float(current_price)
-                        self.watchlist[ticker]['change'] = float(change)
-                        self.watchlist[ticker]['change_pct'] = float(change_pct)
-                        self.watchlist[ticker]['last_updated'] = datetime.now().isoformat()
-                        self.watchlist[ticker]['data'] = hist
-                        self.parent.after(0, lambda t=ticker, p=float(current_price): self.check_alerts(t, p))
-                except:
-                    pass  # Skip failed tickers
-
-            # Update UI on main thread
-            self.parent.after(0, self.save_watchlist)
-            self.parent.after(0, self.display_watchlist)
-            self.parent.after(0, lambda: self.status_label.config(
-                text="✓ All stocks refreshed!",
-                fg=self.colors['success']
-            ))
+            # Reuse fresh cached histories; download the rest in batches
+            histories = {}
+            stale = []
+            for ticker in tickers:
+                hist = self._cached_history(ticker, ttl=ttl)
+                if hist is None:
+                    stale.append(ticker)
+                else:
+                    histories[ticker] = hist
+            try:
+                histories.update(self._download_histories(stale))
+            except RuntimeError:
+                return  # Pool shut down; the module was closed
+            
+            try:
+                changes = _price_changes(histories)
+            except Exception:
+                changes = {}  # Nothing usable came back
+            
+            updates = [
+                (ticker, values, histories[ticker])
+                for ticker, values in changes.items()
+            ]
+            
+            # Apply everything in one pass on the main thread
+            self.parent.after_idle(lambda: self._finalize_refresh(updates))
         
         threading.Thread(target=_refresh, daemon=True).start()
     
-    def display_watchlist(self):
-        """Display all stocks in watchlist"""
-        # Clear existing
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+    def _finalize_refresh(self, updates):
+        """Apply a whole-watchlist refresh: prices, alerts, save and display."""
+        now_iso = datetime.now().isoformat()
+        for ticker, (current_price, change, change_pct), series in updates:
+            entry = self.watchlist.get(ticker)
+            if entry is None:
+                continue  # Removed while refreshing
+            entry['price'] = current_price
+            entry['change'] = change
+            entry['change_pct'] = change_pct
+            entry['last_updated'] = now_iso
+            self._history[ticker] = series
+        self.check_alerts([ticker for ticker, _, _ in updates])
+        self._schedule_save()
         
+        # The module may have been closed while fetching
+        if not self.status_label.winfo_exists():
+            return
+        self._schedule_redraw()
+        self.status_label.config(
+            text="✓ All stocks refreshed!",
+            fg=self.colors['success']
+        )
+    
+    def _schedule_redraw(self):
+        """Coalesce display_watchlist calls into one pass once Tk is idle."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.parent.after_idle(self._do_redraw)
+    
+    def _do_redraw(self):
+        self._redraw_pending = False
+        # The module may have been closed before Tk went idle
+        if self.scrollable_frame.winfo_exists():
+            self.display_watchlist()
+    
+    def display_watchlist(self):
+        """Display all stocks in watchlist, reusing the cards already on screen"""
         # Update count
         self.watchlist_count.config(text=f"({len(self.watchlist)} stocks)")
         
+        # Drop cards of removed stocks
+        for ticker in [t for t in self._cards if t not in self.watchlist]:
+            self._cards.pop(ticker)['frame'].destroy()
+        
         # Empty state
         if not self.watchlist:
-            empty_label = tk.Label(
-                self.scrollable_frame,
-                text="📊 Your watchlist is empty!\n\nAdd stocks like VTI, AAPL, TSLA to track them over time.",
-                font=("Segoe UI", 12),
-                bg=self.colors['content_bg'],
-                fg=self.colors['text_dim'],
-                justify=tk.CENTER
-            )
-            empty_label.pack(pady=50)
+            if self._empty_label is None:
+                self._empty_label = tk.Label(
+                    self.scrollable_frame,
+                    text="📊 Your watchlist is empty!\n\nAdd stocks like VTI, AAPL, TSLA to track them over time.",
+                    font=("Segoe UI", 12),
+                    bg=self.colors['content_bg'],
+                    fg=self.colors['text_dim'],
+                    justify=tk.CENTER
+                )
+                self._empty_label.pack(pady=50)
             return
         
-        # Display each stock
-        for ticker, data in sorted(self.watchlist.items()):
-            self.create_stock_card(ticker, data)
+        if self._empty_label is not None:
+            self._empty_label.destroy()
+            self._empty_label = None
+        
+        # Update existing cards in place; only new stocks get widgets built
+        tickers = sorted(self.watchlist)
+        for i, ticker in enumerate(tickers):
+            if ticker in self._cards:
+                self.update_stock_card(ticker, self.watchlist[ticker])
+                continue
+            card = self._cards[ticker] = self.create_stock_card(ticker, self.watchlist[ticker])
+            # New cards are packed last; slot this one in above the next card alphabetically
+            following = next((self._cards[t]['frame'] for t in tickers[i + 1:] if t in self._cards), None)
+            if following is not None:
+                card['frame'].pack_configure(before=following)
     
     def create_stock_card(self, ticker, data):
-        """Create a card for a stock"""
-        price = data['price']
-        change = data['change']
-        change_pct = data['change_pct']
-        last_updated = data.get('last_updated', 'Unknown')
-        
-        # Determine color based on change
-        if change > 0:
-            change_color = self.colors['success']
-            arrow = "▲"
-        elif change < 0:
-            change_color = self.colors['danger']
-            arrow = "▼"
-        else:
-            change_color = self.colors['text_dim']
-            arrow = "━"
-        
+        """Create a card for a stock and return its updatable widgets"""
+        # Look the colors up once; every widget on the card reuses them
+        colors = self.colors
+        card_bg = colors['card_bg']
+        text_fg = colors['text']
         # Card frame
         card = tk.Frame(
             self.scrollable_frame,
-            bg=self.colors['card_bg'],
+            bg=card_bg,
             relief=tk.RAISED,
             borderwidth=2
         )
         card.pack(fill=tk.X, padx=5, pady=5)
         
         # Header (ticker and actions)
-        header = tk.Frame(card, bg=self.colors['card_bg'])
+        header = tk.Frame(card, bg=card_bg)
         header.pack(fill=tk.X, padx=15, pady=(15, 5))
         
         # Ticker name (left)
@@ -458,138 +890,250 @@ class StockMonitorModule:
             header,
             text=ticker,
             font=("Segoe UI", 14, "bold"),
-            bg=self.colors['card_bg'],
-            fg=self.colors['text']
+            bg=card_bg,
+            fg=text_fg
         ).pack(side=tk.LEFT)
         
         # Actions (right)
-        actions = tk.Frame(header, bg=self.colors['card_bg'])
+        actions = tk.Frame(header, bg=card_bg)
         actions.pack(side=tk.RIGHT)
         
         tk.Button(
             actions,
             text="📈 Plot",
-            font=("Segoe UI", 9),
-            bg=self.colors['accent'],
+            bg=colors['accent'],
             fg="white",
-            cursor="hand2",
             command=lambda t=ticker: self.plot_stock(t),
             padx=10,
-            pady=3
+            **_CARD_BUTTON
         ).pack(side=tk.LEFT, padx=2)
         
         tk.Button(
             actions,
             text="🔄",
-            font=("Segoe UI", 9),
-            bg=self.colors['card_bg'],
-            fg=self.colors['text'],
-            cursor="hand2",
+            bg=card_bg,
+            fg=text_fg,
             command=lambda t=ticker: self.refresh_stock(t),
             padx=8,
-            pady=3
+            **_CARD_BUTTON
         ).pack(side=tk.LEFT, padx=2)
         
+        # The card outlives price updates, so read the price when clicked
         tk.Button(
             actions,
             text="🔔 Alert",
-            font=("Segoe UI", 9),
-            bg=self.colors['warning'],
+            bg=colors['warning'],
             fg="white",
-            cursor="hand2",
-            command=lambda t=ticker, p=price: self.open_alert_dialog(t, p),
+            command=lambda t=ticker: self.open_alert_dialog(t, self.watchlist[t]['price']),
             padx=8,
-            pady=3
+            **_CARD_BUTTON
         ).pack(side=tk.LEFT, padx=2)
 
         tk.Button(
             actions,
             text="✕",
-            font=("Segoe UI", 9),
-            bg=self.colors['danger'],
+            bg=colors['danger'],
             fg="white",
-            cursor="hand2",
             command=lambda t=ticker: self.remove_from_watchlist(t),
             padx=8,
-            pady=3
+            **_CARD_BUTTON
         ).pack(side=tk.LEFT, padx=2)
         
         # Price section
-        price_frame = tk.Frame(card, bg=self.colors['card_bg'])
+        price_frame = tk.Frame(card, bg=card_bg)
         price_frame.pack(fill=tk.X, padx=15, pady=10)
         
         # Current price
-        tk.Label(
+        price_lbl = tk.Label(
             price_frame,
-            text=f"${price:.2f}",
             font=("Segoe UI", 24, "bold"),
-            bg=self.colors['card_bg'],
-            fg=self.colors['text']
-        ).pack(side=tk.LEFT)
+            bg=card_bg,
+            fg=text_fg
+        )
+        price_lbl.pack(side=tk.LEFT)
         
         # Change
-        tk.Label(
+        change_lbl = tk.Label(
             price_frame,
-            text=f"  {arrow} ${abs(change):.2f} ({change_pct:+.2f}%)",
             font=("Segoe UI", 14, "bold"),
-            bg=self.colors['card_bg'],
-            fg=change_color
-        ).pack(side=tk.LEFT, padx=10)
+            bg=card_bg
+        )
+        change_lbl.pack(side=tk.LEFT, padx=10)
         
         # Last updated
+        time_lbl = tk.Label(
+            card,
+            font=("Segoe UI", 9, "italic"),
+            bg=card_bg,
+            fg=colors['text_dim']
+        )
+        time_lbl.pack(anchor=tk.W, padx=15, pady=(0, 15))
+        
+        widgets = {
+            'frame': card,
+            'price_lbl': price_lbl,
+            'change_lbl': change_lbl,
+            'time_lbl': time_lbl,
+        }
+        self._fill_stock_card(widgets, data)
+        return widgets
+    
+    def update_stock_card(self, ticker, data):
+        """Refresh the price, change and timestamp shown on an existing card"""
+        self._fill_stock_card(self._cards[ticker], data)
+    
+    def _fill_stock_card(self, widgets, data):
+        """Write a stock's current values into its card labels"""
+        price = data['price']
+        change = data['change']
+        change_pct = data['change_pct']
+        last_updated = data.get('last_updated', 'Unknown')
+        
+        # Determine arrow and color based on the sign of the change
+        sign = (change > 0) - (change < 0)
+        arrow = _ARROWS[sign]
+        change_color = self.colors[_CHANGE_COLOR_KEYS[sign]]
+        
         try:
             updated_time = datetime.fromisoformat(last_updated)
             time_str = updated_time.strftime("%I:%M %p")
         except:
             time_str = "Unknown"
         
-        tk.Label(
-            card,
-            text=f"Last updated: {time_str}",
-            font=("Segoe UI", 9, "italic"),
-            bg=self.colors['card_bg'],
-            fg=self.colors['text_dim']
-        ).pack(anchor=tk.W, padx=15, pady=(0, 15))
+        price_text = f"${price:.2f}"
+        change_text = f"  {arrow} ${abs(change):.2f} ({change_pct:+.2f}%)"
+        
+        # Skip the Tk round-trips when nothing visible changed
+        shown = (price_text, change_text, change_color, time_str)
+        if widgets.get('shown') == shown:
+            return
+        widgets['shown'] = shown
+        
+        widgets['price_lbl'].config(text=price_text)
+        widgets['change_lbl'].config(text=change_text, fg=change_color)
+        widgets['time_lbl'].config(text=f"Last updated: {time_str}")
     
     def plot_stock(self, ticker):
         """Plot historical data for a stock"""
         if ticker not in self.watchlist:
             return
         
-        data = self.watchlist[ticker].get('data')
-        if data is None or data.empty:
+        # Charts use a longer window, fetched on the first plot and then reused
+        data = self._cached_history(ticker, self.PLOT_PERIOD, self.PLOT_HISTORY_TTL)
+        if data is None:
+            data = self._read_history_file(ticker, self.PLOT_PERIOD, self.PLOT_HISTORY_TTL)
+        if data is not None:
+            self._draw_plot(ticker, data)
+            return
+        
+        if self._yfinance_missing():
+            return
+        
+        self.status_label.config(text=f"Loading {ticker} chart...", fg=self.colors['accent'])
+        
+        def _fetch():
+            try:
+                hist = self._get_history(ticker, self.PLOT_PERIOD, self.PLOT_HISTORY_TTL)
+            except Exception:
+                hist = None
+            self.parent.after(0, lambda: self._finish_plot(ticker, hist))
+        
+        self._pool.submit(_fetch)
+    
+    def _finish_plot(self, ticker, hist):
+        """Show a chart once its history has been fetched."""
+        if not self.status_label.winfo_exists():
+            return
+        self.status_label.config(text="")
+        # Fall back to the 2-day history if the longer window couldn't be fetched
+        if hist is None or not len(hist[1]):
+            hist = self._history.get(ticker)
+        self._draw_plot(ticker, hist)
+    
+    def _draw_plot(self, ticker, series):
+        """Draw a (dates, closes) price history into the ticker's chart window."""
+        if series is None or not len(series[1]):
             messagebox.showwarning("No Data", f"No data available for {ticker}")
             return
+        dates, closes = series
         
         try:
-            plt.figure(figsize=(12, 6))
-            plt.plot(data.index, data['Close'], label='Close Price', linewidth=2)
-            plt.title(f"{ticker} Stock Price", fontsize=16, fontweight='bold')
-            plt.xlabel("Date", fontsize=12)
-            plt.ylabel("Price ($)", fontsize=12)
-            plt.legend(fontsize=11)
-            plt.grid(True, alpha=0.3)
-            plt.tight_layout()
-            plt.show()
+            # Embed the chart in a Tk window instead of pyplot, which would keep
+            # every figure alive and run its own event handling
+            plot = self._plot_windows.get(ticker)
+            if plot is None or not plot['window'].winfo_exists():
+                # matplotlib is only imported once a chart is actually requested
+                try:
+                    from matplotlib.figure import Figure
+                    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+                except ImportError:
+                    messagebox.showerror(
+                        "Matplotlib Required",
+                        "Please install matplotlib to view charts:\npip install matplotlib"
+                    )
+                    return
+                
+                win = tk.Toplevel(self.parent)
+                win.title(f"📈 {ticker} Stock Price")
+                win.geometry("1000x550")
+                win.configure(bg=self.colors['content_bg'])
+                fig = Figure(figsize=(12, 6))
+                canvas = FigureCanvasTkAgg(fig, master=win)
+                canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+                plot = self._plot_windows[ticker] = {
+                    'window': win,
+                    'figure': fig,
+                    'ax': fig.add_subplot(111),
+                    'canvas': canvas,
+                    'series': None,
+                }
+            
+            # Same arrays as last time: the chart is already current
+            if plot['series'] is not series:
+                plot['series'] = series
+                ax = plot['ax']
+                ax.clear()
+                # Plain arrays skip pandas' plotting converters
+                ax.plot(dates, closes, label='Close Price', linewidth=2)
+                ax.set_title(f"{ticker} Stock Price", fontsize=16, fontweight='bold')
+                ax.set_xlabel("Date", fontsize=12)
+                ax.set_ylabel("Price ($)", fontsize=12)
+                ax.legend(fontsize=11)
+                ax.grid(True, alpha=0.3)
+                plot['figure'].tight_layout()
+                plot['canvas'].draw_idle()
+            plot['window'].deiconify()
+            plot['window'].lift()
         except Exception as e:
             messagebox.showerror("Plot Error", f"Failed to plot {ticker}: {str(e)}")
     
+    def _schedule_save(self):
+        """Write the watchlist once changes have been quiet for SAVE_DELAY_MS."""
+        if self._save_job is not None:
+            self.parent.after_cancel(self._save_job)
+        self._save_job = self.parent.after(self.SAVE_DELAY_MS, self._flush_save)
+    
+    def _flush_save(self):
+        if self._save_job is not None:
+            self.parent.after_cancel(self._save_job)
+            self._save_job = None
+        self.save_watchlist()
+    
+    def _write_json(self, path, data):
+        """Write data as JSON unless the file already holds exactly this content."""
+        payload = _dumps(data)
+        digest = _digest(payload)
+        if self._saved_digests.get(path) == digest:
+            return
+        _write_atomic(path, payload)
+        self._saved_digests[path] = digest
+    
     def save_watchlist(self):
         """Save watchlist to file"""
         try:
-            # Convert to serializable format
-            save_data = {}
-            for ticker, data in self.watchlist.items():
-                save_data[ticker] = {
-                    'price': data['price'],
-                    'change': data['change'],
-                    'change_pct': data['change_pct'],
-                    'last_updated': data['last_updated']
-                    # Don't save 'data' DataFrame (not JSON serializable)
-                }
-            
-            with open(self.watchlist_file, 'w') as f:
-                json.dump(save_data, f, indent=2)
+            # Entries hold only JSON values; price histories live in self._history
+            self._write_json(self.watchlist_file, self.watchlist)
+            self._save_bars()
         except Exception as e:
             print(f"Error saving watchlist: {e}")
     
@@ -597,15 +1141,20 @@ class StockMonitorModule:
         """Load watchlist from file"""
         try:
             if os.path.exists(self.watchlist_file):
-                with open(self.watchlist_file, 'r') as f:
-                    self.watchlist = json.load(f)
-                
-                # Initialize 'data' key for each stock (will be populated on refresh)
+                with open(self.watchlist_file, 'rb') as f:
+                    self.watchlist = _loads(f.read())
+                self._saved_digests[self.watchlist_file] = _digest(_dumps(self.watchlist))
+                # Hand-edited entries get the same check as typed ones; they stay in
+                # the file but are left out of refreshes (see _fetchable_tickers)
                 for ticker in self.watchlist:
-                    self.watchlist[ticker]['data'] = None
+                    if not _TICKER_RE.match(ticker):
+                        print(f"Not refreshing invalid ticker in watchlist: {ticker!r}")
         except Exception as e:
             print(f"Error loading watchlist: {e}")
             self.watchlist = {}
+        
+        if self.watchlist:
+            self._load_history_cache()
     
     # ── Alert system ──────────────────────────────────────────────────────────
 
@@ -613,18 +1162,31 @@ class StockMonitorModule:
         """Load price alerts from file."""
         try:
             if os.path.exists(self.alerts_file):
-                with open(self.alerts_file, 'r') as f:
-                    self.alerts = json.load(f)
+                with open(self.alerts_file, 'rb') as f:
+                    self.alerts = _loads(f.read())
+                self._saved_digests[self.alerts_file] = _digest(_dumps(self.alerts))
         except Exception as e:
             print(f"Error loading alerts: {e}")
             self.alerts = {}
 
+    def _schedule_alerts_save(self):
+        """Write the alerts once changes have been quiet for SAVE_DELAY_MS."""
+        self._active_alerts = None  # Every alert change passes through here
+        if self._alerts_save_job is not None:
+            self.parent.after_cancel(self._alerts_save_job)
+        self._alerts_save_job = self.parent.after(self.SAVE_DELAY_MS, self._flush_alerts_save)
+    
+    def _flush_alerts_save(self):
+        if self._alerts_save_job is not None:
+            self.parent.after_cancel(self._alerts_save_job)
+            self._alerts_save_job = None
+        self.save_alerts()
+
     def save_alerts(self):
         """Persist alerts to disk."""
         try:
             os.makedirs(os.path.dirname(self.alerts_file), exist_ok=True)
-            with open(self.alerts_file, 'w') as f:
-                json.dump(self.alerts, f, indent=2)
+            self._write_json(self.alerts_file, self.alerts)
         except Exception as e:
             print(f"Error saving alerts: {e}")
 
@@ -675,7 +1237,7 @@ class StockMonitorModule:
                 'triggered': False,
                 'created_at': datetime.now().isoformat()
             })
-            self.save_alerts()
+            self._schedule_alerts_save()
             refresh_list()
             threshold_entry.delete(0, tk.END)
 
@@ -714,7 +1276,7 @@ class StockMonitorModule:
                     self.alerts[ticker].pop(i)
                     if not self.alerts[ticker]:
                         del self.alerts[ticker]
-                    self.save_alerts()
+                    self._schedule_alerts_save()
                     refresh_list()
 
                 tk.Button(row, text="✕", command=delete_alert,
@@ -723,40 +1285,50 @@ class StockMonitorModule:
 
         refresh_list()
 
-    def check_alerts(self, ticker, current_price):
-        """Check all active alerts for ticker against current_price and fire if triggered."""
-        ticker_alerts = self.alerts.get(ticker, [])
-        if not ticker_alerts:
+    def _pending_alerts(self):
+        """Untriggered alerts by ticker, rebuilt after alert changes."""
+        if self._active_alerts is None:
+            self._active_alerts = {}
+            for ticker, ticker_alerts in self.alerts.items():
+                pending = [a for a in ticker_alerts if not a.get('triggered')]
+                if pending:
+                    self._active_alerts[ticker] = pending
+        return self._active_alerts
+
+    def check_alerts(self, tickers):
+        """Check pending alerts for tickers against their latest prices and fire any that hit."""
+        active = self._pending_alerts()
+        refs = [
+            (ticker, alert)
+            for ticker in tickers if ticker in self.watchlist
+            for alert in active.get(ticker, ())
+        ]
+        if not refs:
             return
-        changed = False
-        for alert in ticker_alerts:
-            if alert.get('triggered'):
-                continue
-            atype = alert['type']
-            threshold = alert['threshold']
-            fired = False
-            if atype == 'above' and current_price >= threshold:
-                fired = True
-                msg = f"{ticker} hit ${current_price:.2f} (alert: above ${threshold:.2f})"
-            elif atype == 'below' and current_price <= threshold:
-                fired = True
-                msg = f"{ticker} hit ${current_price:.2f} (alert: below ${threshold:.2f})"
-            elif atype == 'pct_up':
-                pct = self.watchlist.get(ticker, {}).get('change_pct', 0)
-                if pct >= threshold:
-                    fired = True
-                    msg = f"{ticker} up {pct:.2f}% today (alert: ≥ +{threshold:.2f}%)"
-            elif atype == 'pct_down':
-                pct = self.watchlist.get(ticker, {}).get('change_pct', 0)
-                if pct <= -threshold:
-                    fired = True
-                    msg = f"{ticker} down {abs(pct):.2f}% today (alert: ≤ −{threshold:.2f}%)"
-            if fired:
-                alert['triggered'] = True
-                changed = True
-                self.send_notification(f"🔔 Price Alert: {ticker}", msg, notification_type="warning")
-        if changed:
-            self.save_alerts()
+        import numpy as np
+        
+        types = np.array([_ALERT_CODES.get(a['type'], -1) for _, a in refs], dtype=np.int8)
+        thresholds = np.array([a['threshold'] for _, a in refs], dtype=float)
+        prices = np.array([self.watchlist[t]['price'] for t, _ in refs], dtype=float)
+        pcts = np.array([self.watchlist[t].get('change_pct', 0) for t, _ in refs], dtype=float)
+        fired = (
+            ((types == 0) & (prices >= thresholds))
+            | ((types == 1) & (prices <= thresholds))
+            | ((types == 2) & (pcts >= thresholds))
+            | ((types == 3) & (pcts <= -thresholds))
+        )
+        if not fired.any():
+            return
+        
+        for i in np.flatnonzero(fired):
+            ticker, alert = refs[i]
+            alert['triggered'] = True
+            msg = _ALERT_MESSAGES[alert['type']].format(
+                ticker=ticker, price=prices[i], pct=pcts[i], drop=abs(pcts[i]),
+                threshold=thresholds[i]
+            )
+            self.send_notification(f"🔔 Price Alert: {ticker}", msg, notification_type="warning")
+        self._schedule_alerts_save()
 
     def send_notification(self, title, message, notification_type="info"):
         """Send notification (optional integration)"""
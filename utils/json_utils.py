@@ -0,0 +1,33 @@
+"""
+JSON Helpers — Thunderz Assistant
+
+Compact JSON (de)serialization for the app's data files. Uses orjson when it
+is installed and falls back to the standard json module otherwise.
+
+Usage (from stock_monitor_module.py, pomodoro_module.py):
+    from json_utils import dumps, loads
+    data = dumps(obj)    # -> bytes
+    obj = loads(data)    # bytes or str
+"""
+
+import json
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj):
+    """Serialize to compact JSON bytes (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def loads(data):
+    """Parse JSON bytes (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)